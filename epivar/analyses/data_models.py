@@ -1,68 +1,27 @@
+try:
+    # SIMD-accelerated drop-in gzip; compressed BEDs are decompression-bound
+    from isal import igzip
+except ImportError:
+    import gzip as igzip
+
 import pandas as pd
-from typing import Literal, Type, Optional, Union, ClassVar
-from pydantic import BaseModel, Field, conint, ValidationError
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from typing import Literal, Type, ClassVar
+from pydantic import BaseModel, Field, TypeAdapter, conint, field_validator
+from pydantic import ValidationError as PydanticValidationError
 from django.core.exceptions import ValidationError
 
 
-CHR_OPTIONS_STR = Literal[
-    "1",
-    "2",
-    "3",
-    "4",
-    "5",
-    "6",
-    "7",
-    "8",
-    "9",
-    "10",
-    "11",
-    "12",
-    "13",
-    "14",
-    "15",
-    "16",
-    "17",
-    "18",
-    "19",
-    "20",
-    "21",
-    "22",
-    "X",
-    "Y",
-    "MT",
-]
-
-CHR_OPTIONS_MIXED = Literal[
-    1,
-    2,
-    3,
-    4,
-    5,
-    6,
-    7,
-    8,
-    9,
-    10,
-    11,
-    12,
-    13,
-    14,
-    15,
-    16,
-    17,
-    18,
-    19,
-    20,
-    21,
-    22,
-    "X",
-    "Y",
-    "MT",
-]
+# Accepted chromosome names (1-22, X, Y, MT); membership is a single hash
+# lookup instead of a linear walk over a Literal union
+CHR_SET = frozenset({str(c) for c in range(1, 23)} | {"X", "Y", "MT"})
+STRAND_SET = frozenset({"+", "-", "."})
 
 
 class BEDRecord(BaseModel):
-    chrom: Union[CHR_OPTIONS_STR, CHR_OPTIONS_MIXED] = Field(alias="#chrom")
+    chrom: str = Field(alias="#chrom")
     start: conint(ge=0)
     end: conint(ge=0)
     name: str | None = Field(default=None)
@@ -74,42 +33,149 @@ class BEDRecord(BaseModel):
         "end",
     )
 
+    @field_validator("chrom", mode="before")
+    @classmethod
+    def _check_chrom(cls, value):
+        # Normalize int chromosomes (1 vs "1") before the membership check
+        value = str(value)
+        if value not in CHR_SET:
+            raise ValueError(f"Input should be one of: {', '.join(sorted(CHR_SET))}")
+        return value
+
 
 class GeneListRecord(BaseModel):
     gene_name: str
 
 
+# Validator adaptors compiled once at import; the fallback path reuses them
+# instead of re-entering model construction per row
+_ADAPTERS = {
+    BEDRecord: TypeAdapter(BEDRecord),
+    GeneListRecord: TypeAdapter(GeneListRecord),
+}
+
+
+def _report_invalid_row(row_idx: int, row: dict, model: Type[BaseModel], filepath: str):
+    """Re-run the failing row through Pydantic to get a precise error message."""
+    try:
+        _ADAPTERS[model].validate_python(row)
+    except PydanticValidationError as e:
+        raise ValueError(f"Invalid row number {row_idx} found in {filepath} --> {e}")
+
+    # The vectorized check flagged the row but Pydantic accepts it; be conservative
+    raise ValueError(f"Invalid row number {row_idx} found in {filepath}")
+
+
+def _validate_bed_frame(df: pd.DataFrame, filepath: str, offset: int = 0) -> None:
+    """Column-level BED validation; falls back to Pydantic only on failing rows."""
+    mask = df["#chrom"].astype(str).isin(CHR_SET)
+
+    for column in ("start", "end"):
+        values = pd.to_numeric(df[column], errors="coerce")
+        mask &= values.notna() & (values >= 0)
+
+    if "strand" in df.columns:
+        mask &= df["strand"].isna() | df["strand"].isin(STRAND_SET)
+
+    if not mask.all():
+        bad_idx = int((~mask.to_numpy()).argmax())
+        row = {k: v for k, v in df.iloc[bad_idx].items() if pd.notna(v)}
+        _report_invalid_row(offset + bad_idx + 1, row, BEDRecord, filepath)
+
+
+def _validate_gene_list_frame(df: pd.DataFrame, filepath: str, offset: int = 0) -> None:
+    """Gene lists are a single column of non-empty gene names."""
+    # If file has no header, pandas will auto-generate one, so accept any single column
+    column = df["gene_name"] if "gene_name" in df.columns else df.iloc[:, 0]
+
+    mask = column.notna() & (column.astype(str).str.len() > 0)
+    if not mask.all():
+        bad_idx = int((~mask.to_numpy()).argmax())
+        _report_invalid_row(
+            offset + bad_idx + 1,
+            {"gene_name": column.iloc[bad_idx]},
+            GeneListRecord,
+            filepath,
+        )
+
+
+def _coordinate_ok(column: pa.Array) -> pa.Array:
+    """Non-null, non-negative integer check on a native or string Arrow column."""
+    if pa.types.is_integer(column.type):
+        ok = pc.greater_equal(column, 0)
+    else:
+        # Digits-only implies a non-negative integer
+        ok = pc.utf8_is_digit(pc.cast(column, pa.string()))
+    return pc.and_(column.is_valid(), pc.fill_null(ok, False))
+
+
+def _bed_batch_ok(batch: pa.RecordBatch) -> pa.Array:
+    chrom = pc.cast(batch["#chrom"], pa.string())
+    ok = pc.fill_null(pc.is_in(chrom, value_set=pa.array(sorted(CHR_SET))), False)
+
+    ok = pc.and_(ok, _coordinate_ok(batch["start"]))
+    ok = pc.and_(ok, _coordinate_ok(batch["end"]))
+
+    if "strand" in batch.schema.names:
+        strand = pc.cast(batch["strand"], pa.string())
+        strand_ok = pc.or_(
+            strand.is_null(),
+            pc.fill_null(pc.is_in(strand, value_set=pa.array(sorted(STRAND_SET))), False),
+        )
+        ok = pc.and_(ok, strand_ok)
+
+    return ok
+
+
+def _gene_list_batch_ok(batch: pa.RecordBatch) -> pa.Array:
+    column = pc.cast(batch.column(0), pa.string())
+    return pc.and_(
+        column.is_valid(), pc.fill_null(pc.greater(pc.utf8_length(column), 0), False)
+    )
+
+
+def _read_headers(filepath: str, sep: str) -> tuple:
+    """Read just the header line, without constructing a pandas reader."""
+    opener = igzip.open if str(filepath).endswith(".gz") else open
+    with opener(filepath, "rt") as handle:
+        return tuple(handle.readline().rstrip("\n").split(sep))
+
+
 def validate_file(filepath: str, model: Type[BaseModel], sep: str = "\t") -> None:
     # If model has required headers, validate them
     if hasattr(model, "expected_order"):
-        headers = tuple(pd.read_table(filepath, sep=sep, nrows=1))
+        headers = _read_headers(filepath, sep)
         if not headers[: len(model.expected_order)] == model.expected_order:
             raise ValidationError(
                 f"Submission file should contain headers in following order: "
                 f"{model.expected_order}, provided headers are: {headers}"
             )
 
-    # Load in chunks for memory efficiency
-    chunks = pd.read_table(filepath, sep=sep, chunksize=1000, dtype=str)
-
-    for chunk_idx, chunk in enumerate(chunks, start=1):
-        records = chunk.to_dict(orient="records")
-
-        for row_idx, row in enumerate(records, start=1 + (chunk_idx - 1) * 1000):
-            try:
-                # Special handling for gene list files
-                if model.__name__ == "GeneListRecord":
-                    # GeneListRecord expects only a single column "gene_name"
-                    # If file has no header, pandas will auto-generate one, so handle both cases
-                    if len(row) == 1:
-                        gene_val = next(iter(row.values()))
-                        model(gene_name=gene_val)
-                    else:
-                        model(**row)
-                else:
-                    model(**row)
-
-            except ValidationError as e:
-                raise ValueError(
-                    f"Invalid row number {row_idx} found in {filepath} --> {e}"
-                )
+    batch_ok = _gene_list_batch_ok if model is GeneListRecord else _bed_batch_ok
+    frame_validator = (
+        _validate_gene_list_frame if model is GeneListRecord else _validate_bed_frame
+    )
+
+    # Stream record batches with Arrow's multi-threaded CSV reader and validate
+    # at column level (C-level compute kernels) instead of per-row Pydantic calls
+    offset = 0
+    stream = (
+        igzip.open(filepath, "rb")
+        if str(filepath).endswith(".gz")
+        else pa.input_stream(filepath)
+    )
+    with stream:
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(block_size=1 << 20, use_threads=True),
+            parse_options=pa_csv.ParseOptions(delimiter=sep),
+        )
+        try:
+            for batch in reader:
+                ok = batch_ok(batch)
+                if not pc.all(ok).as_py():
+                    # Fall back to the pandas path to report the exact row
+                    frame_validator(batch.to_pandas(), filepath, offset)
+                offset += batch.num_rows
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Invalid rows found in {filepath} --> {e}")
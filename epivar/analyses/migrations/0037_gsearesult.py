@@ -0,0 +1,24 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyses', '0036_loa_lift_over_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GSEAResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(max_length=255)),
+                ('payload', models.JSONField()),
+                ('gsea', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='collection_results', to='analyses.gsea')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['gsea', 'collection'], name='analyses_gsea_collection_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyses', '0037_gsearesult'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='gsearesult',
+            constraint=models.UniqueConstraint(fields=('gsea', 'collection'), name='analyses_gsea_collection_uniq'),
+        ),
+    ]
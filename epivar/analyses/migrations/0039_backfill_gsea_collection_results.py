@@ -0,0 +1,50 @@
+from django.db import migrations
+
+
+def backfill_collection_results(apps, schema_editor):
+    """Split legacy results["gsea"] blobs into GSEAResult rows.
+
+    Analyses run before GSEAResult existed keep their table inside the
+    monolithic results JSON; the detail view now renders exclusively from
+    collection_results, so those analyses would come up empty without
+    this. The legacy records carry a "Collection" key per row, which
+    gsea_task used to leave in place and now strips after grouping.
+    """
+    GSEA = apps.get_model("analyses", "GSEA")
+    GSEAResult = apps.get_model("analyses", "GSEAResult")
+
+    for gsea in GSEA.objects.exclude(results=None).iterator():
+        results = gsea.results
+        if "gsea" not in results:
+            continue
+
+        by_collection = {}
+        for record in results.pop("gsea") or []:
+            record = dict(record)
+            collection = record.pop("Collection", "")
+            by_collection.setdefault(collection, []).append(record)
+
+        # ignore_conflicts makes re-runs (and analyses that somehow have
+        # both formats) a no-op per the (gsea, collection) constraint
+        GSEAResult.objects.bulk_create(
+            (
+                GSEAResult(gsea=gsea, collection=collection, payload=payload)
+                for collection, payload in by_collection.items()
+            ),
+            ignore_conflicts=True,
+        )
+        gsea.results = results
+        gsea.save(update_fields=["results"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analyses', '0038_gsearesult_unique_collection'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_collection_results, migrations.RunPython.noop
+        ),
+    ]
@@ -114,6 +114,36 @@ class GSEA(BaseAnalysis):
         return "GSEA"
 
 
+class GSEAResult(models.Model):
+    """Per-collection GSEA result rows, cleaned and sorted at ingest.
+
+    Splitting the monolithic ``results`` blob lets the detail view fetch
+    each collection payload directly instead of re-parsing and regrouping
+    the whole JSON document on every request.
+    """
+
+    gsea = models.ForeignKey(
+        GSEA, on_delete=models.CASCADE, related_name="collection_results"
+    )
+    collection = models.CharField(max_length=255)
+    payload = models.JSONField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["gsea", "collection"], name="analyses_gsea_collection_idx"
+            )
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gsea", "collection"], name="analyses_gsea_collection_uniq"
+            )
+        ]
+
+    def __str__(self):
+        return f"GSEA result: {self.collection}"
+
+
 class LOA(BaseAnalysis):
     """LOA-specific analysis model."""
     ALTERNATIVE_CHOICES = (
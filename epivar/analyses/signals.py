@@ -1,16 +1,19 @@
 import os
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
-from django.core.files.storage import default_storage
 
 from .models import GSEA, LOA, SOA
 
 
-def delete_file_if_exists(file_path):
-    """Helper to remove a file if it exists in storage."""
-    if file_path:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+def _file_paths(instance):
+    """Collect paths of all file fields attached to an analysis instance."""
+    fields = [instance.foreground, instance.background]
+
+    # Model-specific cleanup
+    if isinstance(instance, GSEA):
+        fields += [instance.annotated_foreground, instance.annotated_background]
+
+    return [field.path for field in fields if field]
 
 
 @receiver(post_delete, sender=GSEA)
@@ -21,11 +24,9 @@ def delete_associated_files(sender, instance, **kwargs):
     Delete file fields after model deletion.
     Works for all models inheriting from BaseAnalysis.
     """
-    # Always remove foreground & background
-    delete_file_if_exists(instance.foreground.path)
-    delete_file_if_exists(instance.foreground.path)
-
-    # Model-specific cleanup
-    if isinstance(instance, GSEA):
-        delete_file_if_exists(instance.annotated_foreground.path)
-        delete_file_if_exists(instance.annotated_background.path)
+    for path in _file_paths(instance):
+        # Unlink directly instead of an exists+remove syscall pair
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
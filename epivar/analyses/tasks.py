@@ -1,5 +1,11 @@
+import io
+import mmap
 import os
+import re
+import functools
 import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import pybedtools
 import numpy as np
 import pandas as pd
@@ -7,9 +13,10 @@ import gseapy as gp
 
 from django.apps import apps
 from celery import shared_task
+from django.core.cache import cache
 from django.core.files import File
 from django.shortcuts import reverse
-from scipy.stats import fisher_exact
+from scipy.stats import fisher_exact, hypergeom
 from django_celery_results.models import TaskResult
 from django.core.exceptions import ValidationError
 
@@ -25,8 +32,8 @@ from studies.models import (
     IntegrationStatus,
     RecordStatus,
 )
-from .utils import _clean_loa_table, _clean_gsea_table
-from .data_models import BEDRecord, GeneListRecord, validate_file
+from .utils import _adjust_pvalues, _clean_gsea_table
+from .data_models import BEDRecord, GeneListRecord, validate_file, _read_headers, igzip
 
 
 # =========================================================
@@ -34,6 +41,60 @@ from .data_models import BEDRecord, GeneListRecord, validate_file
 # =========================================================
 
 
+def _sorted_annotations(reference):
+    """Sorted on-disk copy of the reference GFF, built once per upload.
+
+    bedtools closest requires coordinate-sorted inputs; sorting the full
+    genome annotation on every request is far more expensive than sorting
+    the submitted BED, so the sorted GFF is cached next to the original
+    and refreshed only when the annotations file changes.
+    """
+    source = Path(reference.annotations_file.path)
+    cached = source.with_suffix(source.suffix + ".sorted")
+
+    if not cached.exists() or cached.stat().st_mtime < source.stat().st_mtime:
+        # Sort into a sibling temp file and publish with an atomic
+        # rename: concurrent workers never see a half-written cache and
+        # a crash mid-sort cannot leave a truncated file behind
+        fd, tmp = tempfile.mkstemp(dir=source.parent, suffix=".sorted.tmp")
+        os.close(fd)
+        try:
+            pybedtools.BedTool(str(source)).sort().saveas(tmp)
+            os.replace(tmp, cached)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    return pybedtools.BedTool(str(cached))
+
+
+def _feature_annotations(reference, feature_type: str):
+    """Sorted GFF restricted to one feature type, cached on disk.
+
+    Most GFF rows are exons/CDS; filtering them out before closest keeps the
+    result frame roughly an order of magnitude smaller than masking after.
+    """
+    source = Path(reference.annotations_file.path)
+    cached = source.with_suffix(f"{source.suffix}.{feature_type}.sorted")
+
+    if not cached.exists() or cached.stat().st_mtime < source.stat().st_mtime:
+        # Same atomic temp-file + rename publish as _sorted_annotations
+        fd, tmp = tempfile.mkstemp(
+            dir=source.parent, suffix=f".{feature_type}.sorted.tmp"
+        )
+        os.close(fd)
+        try:
+            _sorted_annotations(reference).filter(
+                lambda record: record[2] == feature_type
+            ).saveas(tmp)
+            os.replace(tmp, cached)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    return pybedtools.BedTool(str(cached))
+
+
 def _annotate_bed(
     bed_file,
     reference,
@@ -43,7 +104,7 @@ def _annotate_bed(
     require_same_strandedness: bool = False,
 ):
     """Annotate a BED file against the reference GFF."""
-    gff = pybedtools.BedTool(reference.annotations_file.path)
+    gff = _feature_annotations(reference, feature_type)
     bed = pybedtools.BedTool(bed_file.path)
 
     annotations = (
@@ -78,9 +139,7 @@ def _annotate_bed(
         ]
     ]
 
-    annotations = annotations[
-        (annotations.feature == feature_type) & (annotations.distance <= max_distance)
-    ]
+    annotations = annotations[annotations.distance <= max_distance]
 
     if annotations.empty:
         raise ValueError(
@@ -90,33 +149,50 @@ def _annotate_bed(
     return annotations
 
 
+# Gene name extraction from GFF attributes (compiled once)
+_NAME_RE = re.compile(r"Name=([^;]+)")
+
+
 def _extract_genes(annotations):
     """Extract unique gene names from attributes."""
-    return (
-        annotations["attributes"]
-        .str.extract(r"Name=([^;]+)")
-        .dropna()[0]
-        .unique()
-        .tolist()
-    )
+    # Arrow-backed strings run the regex in vectorized UTF-8 kernels
+    attributes = annotations["attributes"].astype("string[pyarrow]")
+    return attributes.str.extract(_NAME_RE, expand=False).dropna().unique().tolist()
 
 
 def _save_annotations(annotations, instance, field_name, original_name):
     """Save annotated DataFrame to instance FileField."""
-    with tempfile.NamedTemporaryFile(suffix=".bed", delete=False) as tmp:
-        annotations.to_csv(tmp.name, sep="\t", index=False)
+    # Spooled file keeps small tables in RAM and spills large ones to disk;
+    # the old named temp file was written, re-read and never unlinked
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as tmp:
+        text = io.TextIOWrapper(tmp, encoding="utf-8", newline="")
+        annotations.to_csv(text, sep="\t", index=False)
+        text.flush()
+
+        tmp.seek(0)
         getattr(instance, field_name).save(
             f"{os.path.basename(original_name)}.annotated.bed",
-            File(open(tmp.name, "rb")),
+            File(tmp),
             save=False,
         )
+        text.detach()
 
 
 def _fallback_background(reference, feature_type: str = "gene"):
-    """Use all annotated genes if no background provided."""
-    gff = pybedtools.BedTool(reference.annotations_file.path).to_dataframe()
-    gff = gff[gff.feature == feature_type]
-    return gff["attributes"].str.extract(r"Name=([^;]+)").dropna()[0].unique().tolist()
+    """Use all annotated genes if no background provided.
+
+    The gene universe is deterministic per reference genome, so it is cached
+    rather than re-parsing the full GFF on every background-less request.
+    """
+
+    def _compute():
+        gff = pybedtools.BedTool(reference.annotations_file.path).to_dataframe()
+        gff = gff[gff.feature == feature_type]
+        return _extract_genes(gff)
+
+    return cache.get_or_set(
+        f"fallback_genes:{reference.id}:{feature_type}", _compute, timeout=None
+    )
 
 
 def _attach_task(instance, task_id):
@@ -135,31 +211,85 @@ def _validate_inputs(instance, input_type: str):
         validate_file(instance.background.path, record_type)
 
 
+def _count_bed_records(path) -> int:
+    """Count data rows of a (possibly gzipped) BED without a subprocess."""
+    is_gzip = str(path).endswith(".gz")
+    opener = igzip.open if is_gzip else open
+
+    # Headers sit at the top of the file; count them with a cheap bounded scan
+    n_header = 0
+    with opener(path, "rt") as handle:
+        for line in handle:
+            if line.strip() and not line.startswith(("#", "track")):
+                break
+            n_header += 1
+
+    total = 0
+    last_byte = b"\n"
+
+    if is_gzip:
+        with igzip.open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                total += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+    else:
+        with open(path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return 0
+            # Newline counting over the mapped file is a memchr loop in C
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), 1 << 24):
+                    total += mm[offset : offset + (1 << 24)].count(b"\n")
+                last_byte = mm[-1:]
+
+    if last_byte != b"\n":
+        total += 1
+
+    return total - n_header
+
+
 def _compute_intersection_with_reference(instance, reference):
     """Compute intersection statistics with reference genome."""
-    reference_bed = pybedtools.BedTool(reference.chrom_size_file_bed.path)
+    reference_path = reference.chrom_size_file_bed.path
     foreground_bed = pybedtools.BedTool(instance.foreground.path)
 
-    fg_intersection = foreground_bed.intersect(reference_bed, u=True).count()
-    fg_total = foreground_bed.count()
-    fg_fraction = fg_intersection / fg_total
+    fg_total = _count_bed_records(instance.foreground.path)
 
     if instance.background:
-        background_bed = pybedtools.BedTool(instance.background.path)
-        fg_bg_intersection = foreground_bed.intersect(
-            background_bed, header=True
-        ).count()
+        # One scan of the foreground against both b-files; -C appends a
+        # per-file overlap count to every foreground interval
+        counts = foreground_bed.intersect(
+            b=[reference_path, instance.background.path], C=True, filenames=True
+        )
+
+        covered = {reference_path: 0, instance.background.path: 0}
+        for interval in counts:
+            fields = interval.fields
+            if int(fields[-1]) > 0:
+                covered[fields[-2]] += 1
+
+        fg_intersection = covered[reference_path]
+        fg_bg_intersection = covered[instance.background.path]
+
         if fg_bg_intersection < fg_total:
             raise ValidationError(
                 f"Foreground is not a subset of background! Intersection: {fg_bg_intersection}, but total: {fg_total}"
             )
 
-        bg_intersection = background_bed.intersect(reference_bed, u=True).count()
-        bg_total = background_bed.count()
+        background_bed = pybedtools.BedTool(instance.background.path)
+        bg_intersection = background_bed.intersect(
+            pybedtools.BedTool(reference_path), u=True
+        ).count()
+        bg_total = _count_bed_records(instance.background.path)
         bg_fraction = bg_intersection / bg_total
     else:
+        fg_intersection = foreground_bed.intersect(
+            pybedtools.BedTool(reference_path), u=True
+        ).count()
         bg_intersection, bg_total, bg_fraction = None, None, None
 
+    fg_fraction = fg_intersection / fg_total
+
     return {
         "foreground_intersection": fg_intersection,
         "foreground_total": fg_total,
@@ -172,9 +302,10 @@ def _compute_intersection_with_reference(instance, reference):
 
 def parse_gene_list(path_to_file):
     """Parse file into unique gene list."""
-    with open(path_to_file, "r") as handle:
-        genes = [line.strip() for line in handle]
-    return list(set(genes))
+    genes = pd.read_csv(
+        path_to_file, header=None, names=["gene_name"], dtype="string[pyarrow]"
+    )
+    return genes["gene_name"].str.strip().drop_duplicates().tolist()
 
 
 # =========================================================
@@ -212,43 +343,73 @@ def step_annotate_and_extract_background(instance, reference):
         return _fallback_background(reference)
 
 
+@functools.lru_cache(maxsize=None)
+def _collection_gene_sets(collection):
+    """Load `{name: genes}` and `{name: id}` for a collection in a single query.
+
+    Cached per worker process: gene sets only change on (re-)import, while
+    every GSEA task needs the same dictionaries.
+    """
+    gene_sets_in_collection = {}
+    mapping = {}
+
+    for obj in GeneSet.objects.filter(collection=collection).only(
+        "name", "id", "genes"
+    ):
+        gene_sets_in_collection[obj.name] = obj.genes["genes"]
+        mapping[obj.name] = obj.id
+
+    return gene_sets_in_collection, mapping
+
+
+def _enrich_one(collection, fg_genes, bg_genes):
+    """Run enrichment for a single collection; returns None on gseapy errors."""
+    gene_sets_in_collection, mapping = _collection_gene_sets(collection)
+
+    res = gp.enrich(
+        gene_list=fg_genes,
+        background=bg_genes,
+        gene_sets=gene_sets_in_collection,
+        outdir=None,
+    ).results
+
+    if not isinstance(res, pd.DataFrame):
+        print(f"Error for {collection}")
+        return None
+
+    res["Collection"] = collection.label
+    res["gene_set_id"] = res["Term"].map(mapping)
+    return res
+
+
 def run_gsea_enrichment(fg_genes, bg_genes: list, universe: str | None = None):
     """Run enrichment across all gene set collections."""
-    results = []
-
     collections = (
-        [c for c in GeneSetCollection if c == universe]
-        if universe
-        else GeneSetCollection
+        [GeneSetCollection(universe)] if universe else list(GeneSetCollection)
     )
 
+    # Warm the gene-set cache from the calling thread so workers stay off the ORM
     for collection in collections:
-        gene_sets_in_collection = {
-            obj.name: obj.genes["genes"]
-            for obj in GeneSet.objects.filter(collection=collection)
-        }
-        mapping = {
-            obj.name: obj.id for obj in GeneSet.objects.filter(collection=collection)
-        }
-
-        res = gp.enrich(
-            gene_list=fg_genes,
-            background=bg_genes,
-            gene_sets=gene_sets_in_collection,
-            outdir=None,
-        ).results
-
-        if isinstance(res, pd.DataFrame):
-            res["Collection"] = collection.label
-            res["gene_set_id"] = res["Term"].map(mapping)
-            results.append(res)
-        else:
-            print(f"Error for {collection}")
+        _collection_gene_sets(collection)
+
+    # Collections are independent; enrich them concurrently (gseapy spends its
+    # time in numpy/scipy which release the GIL)
+    with ThreadPoolExecutor(
+        max_workers=min(len(collections), os.cpu_count())
+    ) as pool:
+        results = [
+            res
+            for res in pool.map(
+                lambda collection: _enrich_one(collection, fg_genes, bg_genes),
+                collections,
+            )
+            if res is not None
+        ]
 
     results = pd.concat(results)
-    results["Overlap fraction"] = results["Overlap"].apply(
-        lambda x: int(x.split("/")[0]) / int(x.split("/")[1])
-    )
+
+    overlap = results["Overlap"].str.split("/", n=1, expand=True).astype("int64")
+    results["Overlap fraction"] = overlap[0] / overlap[1]
     return results
 
 
@@ -262,19 +423,66 @@ def safe_fisher(contingency, alternative):
     return odds_ratio, pvalue
 
 
-def locus_overlap_with_bg(fg, bg, ref, alternative="two-sided") -> dict:
+def safe_fisher_batch(contingencies, alternative):
+    """Fisher tests over a batch of 2x2 tables in one scipy call.
+
+    One-sided alternatives reduce to the hypergeometric tail, which scipy
+    evaluates for the whole (N, 2, 2) stack at once; two-sided keeps the
+    per-table fisher_exact fallback.
+    """
+    if not contingencies:
+        return [], []
+
+    if alternative == "two-sided":
+        tested = [safe_fisher(table, alternative) for table in contingencies]
+        return [t[0] for t in tested], [t[1] for t in tested]
+
+    tables = np.array(contingencies).round(0) + 1
+    a, b = tables[:, 0, 0], tables[:, 0, 1]
+    c, d = tables[:, 1, 0], tables[:, 1, 1]
+
+    # Same parametrization scipy uses for the one-sided fisher_exact
+    total = a + b + c + d
+    if alternative == "greater":
+        pvalues = hypergeom.sf(a - 1, total, a + b, a + c)
+    else:
+        pvalues = hypergeom.cdf(a, total, a + b, a + c)
+
+    odds = (a * d) / (b * c)
+    odds_ratios = [
+        None if (np.isnan(ratio) or np.isinf(ratio)) else float(ratio)
+        for ratio in odds
+    ]
+
+    return odds_ratios, pvalues.tolist()
+
+
+def locus_overlap_with_bg(
+    fg,
+    bg,
+    ref,
+    alternative="two-sided",
+    presorted: bool = False,
+    n_fg: int | None = None,
+    n_bg: int | None = None,
+) -> dict:
     """
     Locus overlap analysis when a background is provided.
+
+    With ``presorted=True`` both inputs and the reference must be
+    coordinate-sorted; bedtools then uses the streaming merge-join
+    (-sorted) instead of loading either side into memory. ``n_fg``/``n_bg``
+    let the caller count each input once instead of per reference set.
     """
     fg = pybedtools.BedTool(fg) if not isinstance(fg, pybedtools.BedTool) else fg
     bg = pybedtools.BedTool(bg) if not isinstance(bg, pybedtools.BedTool) else bg
     ref = pybedtools.BedTool(ref) if not isinstance(ref, pybedtools.BedTool) else ref
 
-    n_fg = len(fg)
-    n_bg = len(bg)
+    n_fg = len(fg) if n_fg is None else n_fg
+    n_bg = len(bg) if n_bg is None else n_bg
 
-    fg_overlap = len(fg.intersect(ref, u=True))
-    bg_overlap = len(bg.intersect(ref, u=True))
+    fg_overlap = len(fg.intersect(ref, u=True, sorted=presorted))
+    bg_overlap = len(bg.intersect(ref, u=True, sorted=presorted))
 
     contingency = [
         [fg_overlap, n_fg - fg_overlap],
@@ -285,21 +493,86 @@ def locus_overlap_with_bg(fg, bg, ref, alternative="two-sided") -> dict:
     bg_frac = bg_overlap / n_bg if n_bg > 0 else 0
     ratio = fg_frac / bg_frac if bg_frac > 0 else 0
 
-    odds_ratio, pvalue = safe_fisher(contingency, alternative)
-
+    # The Fisher test itself is deferred: loa_task batches the contingency
+    # tables of all genomic sets into one scipy call
     return {
         "Foreground_total": n_fg,
         "Background total": n_bg,
         "Foreground overlap": fg_overlap,
         "Background overlap": bg_overlap,
         "Foreground to background ratio": ratio,
-        "Odds Ratio": odds_ratio,
-        "P-value": pvalue,
+        "contingency": contingency,
+    }
+
+
+def _chrom_interval_index(ref) -> dict:
+    """Merged, sorted per-chromosome interval arrays for fast overlap queries."""
+    intervals = (
+        ref.sort(header=True).merge().to_dataframe(names=["chrom", "start", "end"])
+    )
+
+    return {
+        str(chrom): (
+            group["start"].to_numpy(np.int64),
+            group["end"].to_numpy(np.int64),
+        )
+        for chrom, group in intervals.groupby("chrom", sort=False)
+    }
+
+
+def _count_overlaps(chroms, starts, ends, ref_index) -> int:
+    """Count intervals overlapping any reference interval (intersect -u)."""
+    total = 0
+    for chrom in np.unique(chroms):
+        reference = ref_index.get(str(chrom))
+        if reference is None:
+            continue
+
+        ref_starts, ref_ends = reference
+        mask = chroms == chrom
+
+        # An interval overlaps iff some merged reference interval starts
+        # before its end and ends after its start
+        idx = np.searchsorted(ref_starts, ends[mask], side="left")
+        hit = idx > 0
+        hit[hit] = ref_ends[idx[hit] - 1] > starts[mask][hit]
+        total += int(hit.sum())
+
+    return total
+
+
+def _shuffle_context(fg, genome) -> dict:
+    """Chromosome sizes and foreground interval lengths as numpy arrays.
+
+    Both depend only on the foreground and the genome file, so loa_task
+    parses them once and every genomic set reuses the same arrays.
+    """
+    chrom_sizes = pd.read_table(
+        genome, header=None, usecols=[0, 1], names=["chrom", "size"]
+    )
+    sizes = chrom_sizes["size"].to_numpy(np.int64)
+
+    fg_intervals = fg.to_dataframe(disable_auto_names=True)
+    lengths = fg_intervals.iloc[:, 2].to_numpy(np.int64) - fg_intervals.iloc[
+        :, 1
+    ].to_numpy(np.int64)
+
+    return {
+        "chrom_names": chrom_sizes["chrom"].astype(str).to_numpy(),
+        "sizes": sizes,
+        "probabilities": sizes / sizes.sum(),
+        "lengths": lengths,
     }
 
 
 def locus_overlap_with_shuffle(
-    fg, ref, genome, permutations=1000, alternative="two-sided"
+    fg,
+    ref,
+    genome,
+    permutations=1000,
+    alternative="two-sided",
+    presorted: bool = False,
+    context: dict | None = None,
 ) -> dict:
     """
     Locus overlap analysis when no background is provided.
@@ -308,12 +581,33 @@ def locus_overlap_with_shuffle(
     fg = pybedtools.BedTool(fg) if not isinstance(fg, pybedtools.BedTool) else fg
     ref = pybedtools.BedTool(ref) if not isinstance(ref, pybedtools.BedTool) else ref
 
-    n_fg = len(fg)
-    fg_overlap = len(fg.intersect(ref, u=True))
+    # Hoist intervals into sorted numpy arrays and run every permutation as a
+    # handful of vectorized ops instead of one bedtools subprocess each
+    if context is None:
+        context = _shuffle_context(fg, genome)
+    chrom_names = context["chrom_names"]
+    sizes = context["sizes"]
+    probabilities = context["probabilities"]
+    lengths = context["lengths"]
 
-    shuffle_overlaps = [
-        len(fg.shuffle(g=genome, seed=101).intersect(ref, u=True)) for _ in range(permutations)
-    ]
+    n_fg = lengths.size
+    fg_overlap = len(fg.intersect(ref, u=True, sorted=presorted))
+
+    ref_index = _chrom_interval_index(ref)
+
+    rng = np.random.default_rng(101)
+    shuffle_overlaps = np.empty(permutations, dtype=np.int64)
+
+    for i in range(permutations):
+        # Place each interval on a random chromosome (weighted by size) at a
+        # random start where it still fits, mirroring bedtools shuffle
+        chrom_idx = rng.choice(sizes.size, size=lengths.size, p=probabilities)
+        max_start = np.maximum(sizes[chrom_idx] - lengths, 1)
+        starts = (rng.random(lengths.size) * max_start).astype(np.int64)
+
+        shuffle_overlaps[i] = _count_overlaps(
+            chrom_names[chrom_idx], starts, starts + lengths, ref_index
+        )
 
     mean_bg_overlap = np.mean(shuffle_overlaps)
     mean_bg_overlap = mean_bg_overlap if mean_bg_overlap > 1 else 1
@@ -327,37 +621,77 @@ def locus_overlap_with_shuffle(
     bg_frac = mean_bg_overlap / n_fg if n_fg > 0 else 0
     ratio = fg_frac / bg_frac if bg_frac > 0 else 0
 
-    odds_ratio, pvalue = safe_fisher(contingency, alternative)
-
+    # The Fisher test itself is deferred: loa_task batches the contingency
+    # tables of all genomic sets into one scipy call
     return {
         "Foreground_total": n_fg,
         "Background total": n_fg,  # foreground count reused as "background" count
         "Foreground overlap": fg_overlap,
         "Background overlap": mean_bg_overlap,
         "Foreground to background ratio": ratio,
-        "Odds Ratio": odds_ratio,
-        "P-value": pvalue,
+        "contingency": contingency,
     }
 
 
+def _overlapping_study_counts(request_bed, paths, fdr_columns, alpha) -> dict:
+    """Distinct study rows overlapping the request, counted per study file.
+
+    One bedtools pass over all study files; -filenames tags every hit with
+    its source file. Counts are accumulated while streaming the output, so
+    no per-study row set survives the scan. When a study has an FDR column
+    index registered, only rows passing the significance cutoff count.
+    """
+    hits = request_bed.intersect(b=paths, wa=True, wb=True, filenames=True)
+    n_request_fields = request_bed.field_count()
+
+    counts = {path: 0 for path in paths}
+    seen = {path: set() for path in paths}
+
+    for interval in hits:
+        fields = interval.fields
+        path = fields[n_request_fields]
+        row = tuple(fields[n_request_fields + 1 :])
+
+        if row in seen[path]:
+            continue
+        seen[path].add(row)
+
+        fdr_idx = fdr_columns.get(path)
+        if fdr_idx is None or float(row[fdr_idx]) <= alpha:
+            counts[path] += 1
+
+    return counts
+
+
 def _filter_studies(data_class, request, category, pval: float | None = None):
     ref = request.reference_genome
     alpha = request.significance_level
     request_bed = pybedtools.BedTool(request.foreground.path)
-    total = request_bed.count()
+    total = _count_bed_records(request.foreground.path)
+
+    # Join the study in one query (the loop below needs study_id per record)
+    # and fetch only the columns that end up in the result records
+    study_data_records = list(
+        data_class.objects.filter(reference_genome=ref)
+        .select_related("study")
+        .only("data", "study__study_id")
+    )
+    if not study_data_records:
+        return []
 
-    results = []
-    for study_data in data_class.objects.filter(reference_genome=ref).all():
-        ovp = pybedtools.BedTool(study_data.data.path).intersect(
-            request_bed, u=True, header=True
-        )
+    paths = [study_data.data.path for study_data in study_data_records]
 
-        if pval:
-            ovp = ovp.to_dataframe(disable_auto_names=True)
-            ovp = ovp[ovp.FDR <= alpha].shape[0]
-        else:
-            ovp = ovp.count()
+    fdr_columns = {}
+    if pval:
+        for path in paths:
+            headers = _read_headers(path, sep="\t")
+            fdr_columns[path] = headers.index("FDR")
+
+    counts = _overlapping_study_counts(request_bed, paths, fdr_columns, alpha)
 
+    results = []
+    for study_data in study_data_records:
+        ovp = counts[study_data.data.path]
         fraction = ovp / total
         study = study_data.study
         if isinstance(study, AssociationStudy):
@@ -414,9 +748,21 @@ def gsea_task(self, gsea_id, universe=None):
     results = _clean_gsea_table(results, instance.correction_method)
 
     results = results[results["Adjusted P-value"] <= instance.significance_level]
-    results = results.to_dict(orient="records")
 
-    instance.results = {"intersection_stats": intersection_stats, "gsea": results}
+    # Persist one row per collection so the detail view fetches payloads
+    # directly instead of regrouping a monolithic blob on every request
+    GSEAResult_model = apps.get_model("analyses", "GSEAResult")
+    instance.collection_results.all().delete()
+    GSEAResult_model.objects.bulk_create(
+        GSEAResult_model(
+            gsea=instance,
+            collection=collection_name,
+            payload=sub_df.drop("Collection", axis=1).to_dict(orient="records"),
+        )
+        for collection_name, sub_df in results.groupby("Collection")
+    )
+
+    instance.results = {"intersection_stats": intersection_stats}
     instance.save(update_fields=["results"])
 
 
@@ -461,47 +807,115 @@ def loa_task(self, loa_id):
             metrics["background"] = lift_over_metrics(bg_path, lifted_bg.name)
             bg_path = lifted_bg.name
 
-    # Run analysis with temp files
-    fg = pybedtools.BedTool(fg_path)
-    results = []
+    # Run analysis with temp files; sort both inputs once so every per-set
+    # intersect can use the streaming merge-join (feature files are stored
+    # sorted at import time)
+    fg = pybedtools.BedTool(fg_path).sort(header=True)
+    bg = pybedtools.BedTool(bg_path).sort(header=True) if bg_path else None
+
+    # Count the inputs / parse the shuffle arrays once; both are invariant
+    # across genomic sets
+    if bg is not None:
+        n_fg, n_bg = len(fg), len(bg)
+        shuffle_context = None
+    else:
+        shuffle_context = _shuffle_context(
+            fg, instance.reference_genome.chrom_size_file.path
+        )
+
+    # Materialize the (collection, genomic set) pairs up front so only the
+    # main thread touches the ORM; prefetching the features loads every
+    # collection's sets in one extra query instead of one per collection
+    pairs = [
+        (collection, genomic_set)
+        for collection in instance.universe.prefetch_related("features")
+        for genomic_set in collection.features.all()
+    ]
 
-    for collection in instance.universe.all():
-        for genomic_set in collection.features.all():
-            try:
-                ref = genomic_set.file.path
-                stats = {
-                    "collection": collection.name,
-                    "name": genomic_set.name,
-                    "genomic_set_id": genomic_set.id,
-                }
-
-                if bg_path:
-                    bg = pybedtools.BedTool(bg_path)
-                    stats.update(
-                        locus_overlap_with_bg(fg, bg, ref, instance.alternative)
+    def _one_overlap(pair):
+        collection, genomic_set = pair
+        try:
+            ref = genomic_set.file.path
+            stats = {
+                "collection": collection.name,
+                "name": genomic_set.name,
+                "genomic_set_id": genomic_set.id,
+            }
+
+            if bg is not None:
+                stats.update(
+                    locus_overlap_with_bg(
+                        fg,
+                        bg,
+                        ref,
+                        instance.alternative,
+                        presorted=True,
+                        n_fg=n_fg,
+                        n_bg=n_bg,
                     )
-                else:
-                    stats.update(
-                        locus_overlap_with_shuffle(
-                            fg,
-                            ref,
-                            instance.reference_genome.chrom_size_file.path,
-                            permutations=instance.permutations,
-                            alternative=instance.alternative,
-                        )
+                )
+            else:
+                stats.update(
+                    locus_overlap_with_shuffle(
+                        fg,
+                        ref,
+                        instance.reference_genome.chrom_size_file.path,
+                        permutations=instance.permutations,
+                        alternative=instance.alternative,
+                        presorted=True,
+                        context=shuffle_context,
                     )
+                )
+
+            return stats
 
-                results.append(stats)
+        except Exception as e:
+            return {"name": genomic_set.name, "error": str(e)}
 
-            except Exception as e:
-                results.append({"name": genomic_set.name, "error": str(e)})
+    # Feature sets are independent; the per-set work is dominated by bedtools
+    # subprocesses and numpy kernels, so threads fan out across cores
+    results = []
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(len(pairs), os.cpu_count())) as pool:
+            results = list(pool.map(_one_overlap, pairs))
+
+    # Batch the Fisher tests across all genomic sets in one scipy call
+    tested = [record for record in results if "contingency" in record]
+    odds_ratios, pvalues = safe_fisher_batch(
+        [record.pop("contingency") for record in tested], instance.alternative
+    )
+    for record, odds_ratio, pvalue in zip(tested, odds_ratios, pvalues):
+        record["Odds Ratio"] = odds_ratio
+        record["P-value"] = pvalue
+
+    # Clean directly on the record list; a DataFrame round-trip buys
+    # nothing for a few hundred dicts
+    significant = []
+    if tested:
+        pvalues = np.array([record["P-value"] for record in tested], dtype=float)
+        odds = np.array([record["Odds Ratio"] for record in tested], dtype=float)
+
+        eps = np.nextafter(0, 1)
+        adjusted = _adjust_pvalues(pvalues, instance.correction_method)
+        neg_log = -np.log10(adjusted + eps)
+
+        for record, adj, log_adj in zip(tested, adjusted, neg_log):
+            record["Adjusted P-value"] = float(adj)
+            record["-log10(Adjusted P-value)"] = float(log_adj)
+            record["Combined Score"] = (
+                float(log_adj) * record["Odds Ratio"]
+                if record["Odds Ratio"] is not None
+                else None
+            )
 
-    # Convert to DataFrame
-    df = pd.DataFrame(results)
-    df = _clean_loa_table(df, instance.correction_method)
-    df = df[df["Adjusted P-value"] <= instance.significance_level]
+        # Sorted by odds ratio descending (NaN last), significant rows only
+        significant = [
+            tested[i]
+            for i in np.argsort(-odds)
+            if tested[i]["Adjusted P-value"] <= instance.significance_level
+        ]
 
-    instance.results = df.to_dict(orient="records")
+    instance.results = significant
     instance.lift_over_metrics = metrics
 
     instance.save(update_fields=["results", "lift_over_metrics"])
@@ -1,9 +1,29 @@
 import pandas as pd
 import numpy as np
+from scipy.stats import false_discovery_control
 from statsmodels.stats.multitest import multipletests
 
+# BH/BY go through scipy's false_discovery_control, which skips the
+# statsmodels dispatcher; the remaining methods keep multipletests
+_FDR_METHODS = {"fdr_bh": "bh", "fdr_by": "by"}
+
+
+def _adjust_pvalues(pvalues: np.ndarray, correction_method: str) -> np.ndarray:
+    method = _FDR_METHODS.get(correction_method)
+    if method:
+        return false_discovery_control(pvalues, method=method)
+
+    _, adjusted, _, _ = multipletests(
+        pvalues, method=correction_method, alpha=0.05, is_sorted=False
+    )
+    return adjusted
+
 
 def _clean_gsea_table(df: pd.DataFrame, correction_method: str) -> pd.DataFrame:
+    # Already cleaned (and sorted) at ingest; nothing to recompute
+    if "-log10(Adjusted P-value)" in df.columns:
+        return df
+
     # drop default values
     df = df.drop(
         [
@@ -13,27 +33,15 @@ def _clean_gsea_table(df: pd.DataFrame, correction_method: str) -> pd.DataFrame:
         axis=1,
     )
 
-    # recalculate
+    # recalculate; every step stays on the numpy arrays until assignment
     eps = np.nextafter(0, 1)
-    _, df["Adjusted P-value"], _, _ = multipletests(
-        df["P-value"], method=correction_method, alpha=0.05, is_sorted=False
-    )
-    df["-log10(Adjusted P-value)"] = df["Adjusted P-value"].map(
-        lambda x: -np.log10(x + eps)
-    )
-    df["Combined Score"] = df["-log10(Adjusted P-value)"] * df["Odds Ratio"]
-
-    return df.sort_values("Odds Ratio", ascending=False)
-
+    odds = df["Odds Ratio"].to_numpy()
+    adjusted = _adjust_pvalues(df["P-value"].to_numpy(), correction_method)
+    neg_log = -np.log10(adjusted + eps)
 
-def _clean_loa_table(df: pd.DataFrame, correction_method: str) -> pd.DataFrame:
-    eps = np.nextafter(0, 1)
-    _, df["Adjusted P-value"], _, _ = multipletests(
-        df["P-value"], method=correction_method, alpha=0.05, is_sorted=False
-    )
-    df["-log10(Adjusted P-value)"] = df["Adjusted P-value"].map(
-        lambda x: -np.log10(x + eps)
-    )
-    df["Combined Score"] = df["-log10(Adjusted P-value)"] * df["Odds Ratio"]
+    df["Adjusted P-value"] = adjusted
+    df["-log10(Adjusted P-value)"] = neg_log
+    df["Combined Score"] = neg_log * odds
 
-    return df.sort_values("Odds Ratio", ascending=False)
+    # argsort + take skips the pandas sorting machinery (NaN still last)
+    return df.take(np.argsort(-odds))
@@ -1,8 +1,11 @@
+import json
+
 import plotly.express as px
 import numpy as np
 import pandas as pd
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Value
 from django.views.generic import CreateView, ListView, DetailView, DeleteView
 from django.contrib import messages
 from django.urls import reverse_lazy
@@ -10,7 +13,6 @@ from django.shortcuts import redirect, reverse
 
 from .tasks import gsea_task, loa_task, soa_task
 from .forms import GSEAform, LOAForm, SOAForm
-from .utils import _clean_gsea_table
 from .plots import bubble_plot
 from .models import GSEA, LOA, SOA
 
@@ -24,24 +26,26 @@ class AnalysesList(LoginRequiredMixin, ListView):
         qs = super().get_queryset()
         return qs.filter(submitter=self.request.user)
 
+    # Columns shared by all three analysis models; task__status joins the
+    # Celery result in the same query instead of one lookup per row
+    _list_columns = ("id", "title", "created_at", "category", "task__status")
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
 
-        # Add category field for template logic
-        gsea = GSEA.objects.filter(submitter=user).order_by("created_at")
-        for obj in gsea:
-            obj.category = "GSEA"
-
-        loa = LOA.objects.filter(submitter=user).order_by("created_at")
-        for obj in loa:
-            obj.category = "LOA"
-
-        soa = SOA.objects.filter(submitter=user).order_by("created_at")
-        for obj in soa:
-            obj.category = "SOA"
+        # One UNION query with the category annotated in the database
+        # instead of three materialized querysets mutated in Python
+        gsea, loa, soa = (
+            model.objects.filter(submitter=user)
+            .annotate(category=Value(category))
+            .values(*self._list_columns)
+            for model, category in ((GSEA, "GSEA"), (LOA, "LOA"), (SOA, "SOA"))
+        )
 
-        context["analyses"] = [*list(gsea), *list(loa), *list(soa)]
+        # UNION ALL: the three models cannot produce identical rows, so the
+        # database skips the duplicate-elimination sort
+        context["analyses"] = gsea.union(loa, soa, all=True).order_by("-created_at")
         return context
 
 
@@ -78,22 +82,30 @@ class GSEADetailView(LoginRequiredMixin, DetailView):
         gsea = self.object
 
         results = gsea.results or {}
-        df = pd.DataFrame.from_records(results.get("gsea", []))
 
         collections = []
-        if not df.empty:
-            for collection_name, sub_df in df.groupby("Collection"):
-                # Clean & filter table
-                sub_df = _clean_gsea_table(
-                    sub_df, correction_method=gsea.correction_method
-                )
-                sub_df = sub_df[sub_df["Adjusted P-value"] <= gsea.significance_level]
-
+        result_rows = list(gsea.collection_results.order_by("collection"))
+        if result_rows:
+            # Resolve the URL pattern once; per-row reverse() walks the
+            # resolver for every record
+            url_prefix, url_suffix = reverse("gene-set-detail", args=[0]).rsplit(
+                "0", 1
+            )
+
+            # Tables are cleaned, significance-filtered and split per
+            # collection once in the task; the view renders each payload
+            for row in result_rows:
+                sub_df = pd.DataFrame.from_records(row.payload)
                 if not sub_df.empty:
-                    # Convert Term to clickable link
-                    sub_df["Term"] = sub_df.apply(
-                        lambda row: f'<a href="{reverse("gene-set-detail", args=[row["gene_set_id"]])}">{row["Term"]}</a>',
-                        axis=1,
+                    # Convert Term to clickable link (vectorized concatenation)
+                    sub_df["Term"] = (
+                        '<a href="'
+                        + url_prefix
+                        + sub_df["gene_set_id"].astype(str)
+                        + url_suffix
+                        + '">'
+                        + sub_df["Term"].astype(str)
+                        + "</a>"
                     )
                     sub_df = sub_df.drop("gene_set_id", axis=1)
                     plot_html = bubble_plot(sub_df.iloc[:50])
@@ -103,20 +115,14 @@ class GSEADetailView(LoginRequiredMixin, DetailView):
                 sub_df.columns = [n.capitalize() for n in sub_df.columns]
                 collections.append(
                     {
-                        "name": collection_name,
-                        "table_html": sub_df.to_html(
-                            classes=[
-                                "datatable",
-                                "table",
-                                "table-striped",
-                                "table-hover",
-                                "table-sm",
-                            ],
-                            index=False,
-                            escape=False,
-                            border=0,
-                            table_id=f"table-{collection_name}",
-                        ),
+                        "name": row.collection,
+                        "dom_id": f"collection-{len(collections)}",
+                        # DataTables builds the rows client-side from this
+                        # payload; to_json handles NaN -> null natively
+                        "payload": {
+                            "columns": list(sub_df.columns),
+                            "data": json.loads(sub_df.to_json(orient="values")),
+                        },
                         "plot_html": plot_html,
                     }
                 )
@@ -197,6 +203,12 @@ class LOADetailView(LoginRequiredMixin, DetailView):
         if loa.results:
             df = pd.DataFrame.from_records(loa.results)
 
+            # Resolve the URL pattern once; per-row reverse() walks the
+            # resolver for every record
+            url_prefix, url_suffix = reverse(
+                "genomic-feature-detail", args=[0]
+            ).rsplit("0", 1)
+
             # Split per 'collection'
             for name, subdf in df.groupby("collection"):
                 if subdf.empty:
@@ -204,26 +216,27 @@ class LOADetailView(LoginRequiredMixin, DetailView):
 
                 fig_html = bubble_plot(subdf, hover="name", size="Foreground overlap")
 
-                subdf["name"] = subdf.apply(
-                    lambda
-                        row: f'<a href="{reverse("genomic-feature-detail", args=[row["genomic_set_id"]])}">{row["name"]}</a>',
-                    axis=1,
+                subdf["name"] = (
+                    '<a href="'
+                    + url_prefix
+                    + subdf["genomic_set_id"].astype(str)
+                    + url_suffix
+                    + '">'
+                    + subdf["name"].astype(str)
+                    + "</a>"
                 )
                 subdf = subdf.drop("genomic_set_id", axis=1)
                 subdf.columns = [n.capitalize() for n in subdf.columns]
 
-                table_html = subdf.to_html(
-                    classes="table table-sm table-striped datatable",
-                    index=False,
-                    border=0,
-                    escape=False,
-                )
-
                 collections.append(
                     {
                         "name": name,
+                        "dom_id": f"collection-{len(collections)}",
+                        "payload": {
+                            "columns": list(subdf.columns),
+                            "data": json.loads(subdf.to_json(orient="values")),
+                        },
                         "plot_html": fig_html,
-                        "table_html": table_html,
                     }
                 )
 
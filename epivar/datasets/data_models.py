@@ -1,6 +1,13 @@
+import csv
+import gzip
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 from typing import Literal, Type, Optional, Union, ClassVar
-from pydantic import BaseModel, Field, conint, confloat, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, conint, confloat
+from pydantic import ValidationError as PydanticValidationError
 from django.core.exceptions import ValidationError
 
 
@@ -135,20 +142,218 @@ class InteractionRecord(BaseModel):
     )
 
 
+# Plain sets mirroring the Literal options above, usable in vectorized checks
+CHR_SET = {str(c) for c in CHR_OPTIONS_MIXED.__args__}
+STRAND_SET = {"+", "-", "."}
+
+# Validator adaptors compiled once at import; only rows failing a vectorized
+# column check go through Pydantic to produce the error message
+_ADAPTERS = {
+    model: TypeAdapter(model)
+    for model in (AssociationRecord, ProfilingRecord, InteractionRecord)
+}
+
+
+def _chrom_ok(column):
+    return column.astype(str).isin(CHR_SET)
+
+
+def _coord_ok(column):
+    values = pd.to_numeric(column, errors="coerce")
+    # conint semantics: coordinates must be integral, so "1.5" fails
+    # here just as it does in the Arrow digit check
+    return values.notna() & (values >= 0) & (values % 1 == 0)
+
+
+def _unit_interval_ok(column):
+    values = pd.to_numeric(column, errors="coerce")
+    return values.notna() & (values >= 0) & (values <= 1)
+
+
+def _non_negative_ok(column):
+    values = pd.to_numeric(column, errors="coerce")
+    return values.notna() & (values >= 0)
+
+
+def _score_ok(column):
+    return column.astype(str) == "."
+
+
+def _strand_ok(column):
+    return column.isin(STRAND_SET)
+
+
+def _name_ok(column):
+    return column.notna()
+
+
+_COLUMN_CHECKS = {
+    AssociationRecord: {
+        "#chrom": _chrom_ok,
+        "start": _coord_ok,
+        "end": _coord_ok,
+        "name": _name_ok,
+        "score": _score_ok,
+        "strand": _strand_ok,
+        "es": _unit_interval_ok,
+        "p-value": _unit_interval_ok,
+    },
+    ProfilingRecord: {
+        "#chrom": _chrom_ok,
+        "start": _coord_ok,
+        "end": _coord_ok,
+        "name": _name_ok,
+        "score": _score_ok,
+        "strand": _strand_ok,
+        "me": _non_negative_ok,
+    },
+    InteractionRecord: {
+        "#chrom1": _chrom_ok,
+        "start1": _coord_ok,
+        "end1": _coord_ok,
+        "chrom2": _name_ok,
+        "start2": _coord_ok,
+        "end2": _coord_ok,
+        "name": _name_ok,
+        "score": _score_ok,
+        "strand1": _strand_ok,
+        "strand2": _strand_ok,
+        "es": _unit_interval_ok,
+        "p-value": _unit_interval_ok,
+    },
+}
+
+
+# Arrow twins of the pandas checks above, applied to streamed record batches
+def _pa_chrom_ok(column):
+    chrom = pc.cast(column, pa.string())
+    return pc.fill_null(pc.is_in(chrom, value_set=pa.array(sorted(CHR_SET))), False)
+
+
+def _pa_coord_ok(column):
+    if pa.types.is_integer(column.type):
+        ok = pc.greater_equal(column, 0)
+    else:
+        # Digits-only implies a non-negative integer
+        ok = pc.utf8_is_digit(pc.cast(column, pa.string()))
+    return pc.and_(column.is_valid(), pc.fill_null(ok, False))
+
+
+def _pa_unit_interval_ok(column):
+    values = pc.cast(column, pa.float64())
+    ok = pc.and_(pc.greater_equal(values, 0), pc.less_equal(values, 1))
+    return pc.and_(column.is_valid(), pc.fill_null(ok, False))
+
+
+def _pa_non_negative_ok(column):
+    values = pc.cast(column, pa.float64())
+    return pc.and_(column.is_valid(), pc.fill_null(pc.greater_equal(values, 0), False))
+
+
+def _pa_score_ok(column):
+    return pc.fill_null(pc.equal(pc.cast(column, pa.string()), "."), False)
+
+
+def _pa_strand_ok(column):
+    strand = pc.cast(column, pa.string())
+    return pc.fill_null(pc.is_in(strand, value_set=pa.array(sorted(STRAND_SET))), False)
+
+
+def _pa_name_ok(column):
+    return column.is_valid()
+
+
+_PA_CHECK_TWINS = {
+    _chrom_ok: _pa_chrom_ok,
+    _coord_ok: _pa_coord_ok,
+    _unit_interval_ok: _pa_unit_interval_ok,
+    _non_negative_ok: _pa_non_negative_ok,
+    _score_ok: _pa_score_ok,
+    _strand_ok: _pa_strand_ok,
+    _name_ok: _pa_name_ok,
+}
+
+_PA_COLUMN_CHECKS = {
+    model: {column: _PA_CHECK_TWINS[check] for column, check in checks.items()}
+    for model, checks in _COLUMN_CHECKS.items()
+}
+
+
+def _report_invalid_row(row_idx: int, row: dict, model: Type[BaseModel], filepath: str):
+    """Re-run the failing row through Pydantic to get a precise error message."""
+    try:
+        _ADAPTERS[model].validate_python(row)
+    except PydanticValidationError as e:
+        raise ValueError(f"Invalid row number {row_idx} found in {filepath} --> {e}")
+
+    # The vectorized check flagged the row but Pydantic accepts it; be conservative
+    raise ValueError(f"Invalid row number {row_idx} found in {filepath}")
+
+
+def _validate_frame(
+    df: pd.DataFrame, model: Type[BaseModel], filepath: str, offset: int = 0
+) -> None:
+    """Column-level pandas validation; reports the first failing row."""
+    mask = pd.Series(True, index=df.index)
+    for column, check in _COLUMN_CHECKS[model].items():
+        mask &= check(df[column])
+
+    if not mask.all():
+        bad_idx = int((~mask.to_numpy()).argmax())
+        row = {k: v for k, v in df.iloc[bad_idx].items() if pd.notna(v)}
+        _report_invalid_row(offset + bad_idx + 1, row, model, filepath)
+
+
+def _validate_with_pandas(filepath: str, model: Type[BaseModel], sep: str) -> None:
+    # Large chunks validated at column level (numpy ops) instead of one
+    # Pydantic model instantiation per row
+    offset = 0
+    for chunk in pd.read_table(filepath, sep=sep, chunksize=100_000, dtype=str):
+        _validate_frame(chunk, model, filepath, offset)
+        offset += len(chunk)
+
+
+def _validate_with_arrow(filepath: str, model: Type[BaseModel], sep: str) -> None:
+    checks = _PA_COLUMN_CHECKS[model]
+
+    offset = 0
+    reader = pa_csv.open_csv(
+        filepath,
+        read_options=pa_csv.ReadOptions(block_size=1 << 20, use_threads=True),
+        parse_options=pa_csv.ParseOptions(delimiter=sep),
+    )
+    for batch in reader:
+        ok = None
+        for column, check in checks.items():
+            column_ok = check(batch[column])
+            ok = column_ok if ok is None else pc.and_(ok, column_ok)
+
+        if not pc.all(ok).as_py():
+            # Fall back to the pandas path to report the exact row
+            _validate_frame(batch.to_pandas(), model, filepath, offset)
+        offset += batch.num_rows
+
+
+def _read_headers(filepath: str, sep: str) -> tuple:
+    """Read just the header row, without constructing a pandas reader."""
+    opener = gzip.open if str(filepath).endswith(".gz") else open
+    with opener(filepath, "rt", newline="") as handle:
+        return tuple(next(csv.reader(handle, delimiter=sep)))
+
+
 def validate_file(filepath: str, model: Type[BaseModel], sep: str = "\t") -> None:
     if model.expected_order:
-        headers = tuple(pd.read_table(filepath, sep=sep, nrows=1).columns)
+        headers = _read_headers(filepath, sep)
         if not headers == model.expected_order:
             raise ValidationError(
                 f"Submission file should contains headers in following order: {model.expected_order}, provided headers are: {headers}"
             )
 
-    chunks = pd.read_table(filepath, sep=sep, chunksize=1000)
-    for chunk in chunks:
-        records = chunk.to_dict(orient="records")
-
-        for i, row in enumerate(records, start=1):
-            try:
-                model(**row)
-            except ValidationError as e:
-                raise ValueError(f"Invalid row number {i} found in {filepath} --> {e}")
+    # Stream record batches with Arrow's multi-threaded CSV reader; the
+    # checks run as C-level compute kernels. Files Arrow cannot parse or
+    # cast (e.g. text in a numeric column) are re-read with pandas, which
+    # pinpoints the offending row
+    try:
+        _validate_with_arrow(filepath, model, sep)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        _validate_with_pandas(filepath, model, sep)
@@ -8,7 +8,7 @@ from studies.models import AssociationStudy, InteractionStudy, ProfilingStudy
 from reference_genomes.models import ReferenceGenome
 from polymorphic.models import PolymorphicModel
 
-from .tasks import update_file_checksum_task
+from .tasks import update_file_checksums_batch_task
 
 ####################
 # Constants
@@ -91,39 +91,53 @@ class BaseData(TimestampedModel, PolymorphicModel):
     liftover = models.BooleanField(default=False, editable=False)
     plots = models.JSONField(blank=True, null=True)
 
+    # File fields whose checksums update_file_checksum_task maintains
+    _CHECKSUM_FIELDS = (
+        ("data", "data_checksum"),
+        ("data_index", "data_index_checksum"),
+        ("annotations", "annotations_checksum"),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot_file_names()
+
+    def _snapshot_file_names(self):
+        """Remember file names so save() can skip unchanged files."""
+        # Raw __dict__ values so deferred fields are not fetched here
+        self._loaded_file_names = {
+            field: str(self.__dict__[field]) if self.__dict__.get(field) else None
+            for field, _ in self._CHECKSUM_FIELDS
+            if field in self.__dict__
+        }
+
     def save(self, *args, **kwargs):
-        if self.data:
-            if self.data.path:
-                update_file_checksum_task.delay_on_commit(
-                    "datasets",
-                    self.__class__.__name__,
-                    self.id,
-                    "data",
-                    "data_checksum",
-                )
-
-        if self.data_index:
-            if self.data_index.path:
-                update_file_checksum_task.delay_on_commit(
-                    "datasets",
-                    self.__class__.__name__,
-                    self.id,
-                    "data_index",
-                    "data_index_checksum",
-                )
-
-        if self.annotations:
-            if self.annotations.path:
-                update_file_checksum_task.delay_on_commit(
-                    "datasets",
-                    self.__class__.__name__,
-                    self.id,
-                    "annotations",
-                    "annotations_checksum",
-                )
+        # Only re-checksum files that changed since loading (or were never
+        # hashed); edits to unrelated fields would otherwise re-hash
+        # multi-GB files on every save
+        pending = [
+            (field, checksum_field)
+            for field, checksum_field in self._CHECKSUM_FIELDS
+            if (file := getattr(self, field))
+            and file.path
+            and (
+                file.name != self._loaded_file_names.get(field)
+                or not getattr(self, checksum_field)
+            )
+        ]
 
         super().save(*args, **kwargs)
 
+        if pending:
+            update_file_checksums_batch_task.delay_on_commit(
+                [
+                    ("datasets", self.__class__.__name__, self.id, field, checksum_field)
+                    for field, checksum_field in pending
+                ]
+            )
+
+        self._snapshot_file_names()
+
 
 ####################
 # Data subclasses
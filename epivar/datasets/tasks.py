@@ -1,15 +1,41 @@
 import hashlib
+import os
+
 from celery import shared_task
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
 
 
-def calculate_md5(file_obj):
-    """Calculate md5 checksum for a file-like object."""
-    md5 = hashlib.md5()
-    for chunk in iter(lambda: file_obj.read(64 * 1024), b""):
-        md5.update(chunk)
-    return md5.hexdigest()
+def calculate_checksum(file_obj):
+    """Calculate a SHA-256 checksum for a file-like object.
+
+    The checksums are only used for change detection; SHA-256 runs on the
+    SHA-NI hardware path through OpenSSL, several times faster than MD5.
+    usedforsecurity=False lets restricted OpenSSL providers (e.g. FIPS
+    builds) still dispatch their fastest implementation. 1 MB reads keep
+    the loop overhead negligible for multi-GB files.
+    """
+    digest = hashlib.new("sha256", usedforsecurity=False)
+
+    # Local files: hint sequential access so kernel readahead fetches the
+    # next blocks while the current one is being hashed, overlapping IO
+    # with compute; remote storage objects simply skip the hint
+    try:
+        os.posix_fadvise(file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError, ValueError):
+        pass
+
+    if hasattr(file_obj, "readinto"):
+        # One reusable buffer instead of a fresh bytes object per chunk
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        while read := file_obj.readinto(buffer):
+            digest.update(view[:read])
+    else:
+        for chunk in iter(lambda: file_obj.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
 
 
 @shared_task(bind=True, max_retries=3)
@@ -42,7 +68,7 @@ def update_file_checksum_task(
         # Access storage backend and stream the file
         field = Model._meta.get_field(file_field_name)
         with field.storage.open(file_path, "rb") as f:
-            checksum = calculate_md5(f)
+            checksum = calculate_checksum(f)
 
         # Update the checksum field directly in the database
         updated = Model.objects.filter(pk=object_id).update(
@@ -61,3 +87,66 @@ def update_file_checksum_task(
     except Exception as exc:
         # Retry in case of transient errors
         raise self.retry(exc=exc, countdown=10)
+
+
+@shared_task(bind=True, max_retries=3)
+def update_file_checksums_batch_task(self, targets):
+    """
+    Celery task: checksum several file fields in one worker invocation.
+
+    A single save can dirty multiple file fields; dispatching them as one
+    batch pays the task overhead once and lands all checksums for an
+    object in a single UPDATE instead of one per field.
+
+    Args:
+        targets (list): (app_label, model_name, object_id, file_field_name,
+            checksum_field_name) tuples.
+    """
+    try:
+        updates = {}
+        for app_label, model_name, object_id, file_field, checksum_field in targets:
+            Model = apps.get_model(app_label, model_name)
+
+            # Get only the file path (avoid loading whole instance)
+            file_path = (
+                Model.objects.filter(pk=object_id)
+                .values_list(file_field, flat=True)
+                .first()
+            )
+            if not file_path:
+                continue
+
+            field = Model._meta.get_field(file_field)
+            with field.storage.open(file_path, "rb") as f:
+                updates.setdefault((app_label, model_name, object_id), {})[
+                    checksum_field
+                ] = calculate_checksum(f)
+
+        # One bulk_update per model collapses the per-object UPDATEs into a
+        # single CASE WHEN statement per batch
+        per_model = {}
+        for (app_label, model_name, object_id), checksums in updates.items():
+            per_model.setdefault((app_label, model_name), {})[object_id] = checksums
+
+        for (app_label, model_name), checksums_by_pk in per_model.items():
+            Model = apps.get_model(app_label, model_name)
+            instances = Model.objects.in_bulk(checksums_by_pk)
+
+            fields = set()
+            for object_id, checksums in checksums_by_pk.items():
+                if (instance := instances.get(object_id)) is None:
+                    continue
+                for checksum_field, checksum in checksums.items():
+                    setattr(instance, checksum_field, checksum)
+                fields.update(checksums)
+
+            if fields:
+                Model.objects.bulk_update(
+                    instances.values(), fields=sorted(fields), batch_size=500
+                )
+
+        return f"Checksums updated for {len(updates)} object(s)"
+
+    except Exception as exc:
+        # Retry in case of transient errors
+        raise self.retry(exc=exc, countdown=10)
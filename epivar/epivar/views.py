@@ -7,8 +7,10 @@ from studies.models import IntegrationStatus
 from studies.models import AssociationStudy, InteractionStudy, ProfilingStudy
 
 
+@cache_page(60 * 15)
 def home(request):
-    gene_sets_number = len(GeneSet.objects.all())
+    # COUNT(*) in the database instead of materializing every row
+    gene_sets_number = GeneSet.objects.count()
     gene_sets_number = round(gene_sets_number / 10**3, 0)
 
     studies_number = 0
@@ -1,3 +1,4 @@
+import csv
 import os
 import sys
 import shutil
@@ -16,7 +17,7 @@ def delete_temp_dir(path="temp/"):
         print(f"Directory does not exist: {path}")
 
 
-def download_file(url, save_dir="temp/", filename=None):
+def download_file(url, save_dir="temp/", filename=None, session=None):
     # Create the directory if it doesn't exist
     os.makedirs(save_dir, exist_ok=True)
 
@@ -26,15 +27,16 @@ def download_file(url, save_dir="temp/", filename=None):
     # Full path for saving the file
     file_path = os.path.join(save_dir, filename)
 
-    # Download the file
+    # Download the file; a shared session reuses the TCP connection
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()  # Raise an error on bad status
+        with (session or requests).get(url, stream=True) as response:
+            response.raise_for_status()  # Raise an error on bad status
 
-        # Write to file
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            # Copy the raw stream in 1 MiB buffers; per-8KiB iter_content
+            # chunks paid a Python call and SSL round per few KB
+            response.raw.decode_content = True  # CDN may gzip the CSVs
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
         print(f"File downloaded and saved to: {file_path}")
         return Path(file_path)
@@ -44,22 +46,32 @@ def download_file(url, save_dir="temp/", filename=None):
         sys.exit(-1)
 
 
-def parse_asct_table(path):
+def parse_asct_table(path) -> pd.DataFrame:
     expected_columns = {"AS/1", "AS/1/ID", "CT/1", "CT/1/ID"}
     max_skip_rows = 25
 
-    for skip in range(max_skip_rows):
-        try:
-            asct_table = pd.read_csv(path, skiprows=skip)
-            if expected_columns.issubset(set(asct_table.columns)):
-                asct_table = asct_table[list(expected_columns)]
+    # Locate the header in one streaming pass instead of fully re-parsing
+    # the file for every candidate skip count
+    with open(path, newline="") as handle:
+        for _ in range(max_skip_rows):
+            line_start = handle.tell()
+            line = handle.readline()
+            if line and expected_columns.issubset(next(csv.reader([line]))):
                 break
-        except ParserError:
-            pass
-    else:
-        raise ValueError(
-            "Expected columns not found in the CSV file after checking multiple headers."
-        )
+        else:
+            raise ValueError(
+                "Expected columns not found in the CSV file after checking multiple headers."
+            )
+
+        handle.seek(line_start)
+        try:
+            # pyarrow's multithreaded parser; it takes the header from the
+            # current handle position, so no skiprows support is needed
+            asct_table = pd.read_csv(
+                handle, engine="pyarrow", usecols=list(expected_columns)
+            )
+        except (ImportError, ParserError, ValueError):
+            handle.seek(line_start)
+            asct_table = pd.read_csv(handle)[list(expected_columns)]
 
-    asct_table = asct_table.dropna()
-    return asct_table.iterrows()
+    return asct_table.dropna()
@@ -1,5 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from django.core.management.base import BaseCommand
 from ontologies.models import AnatomicalStructure, CellType
+from ontologies.tasks import fetch_ontology_data_batch_task
 
 from ._private import download_file, delete_temp_dir, parse_asct_table
 from tqdm import tqdm
@@ -41,35 +47,117 @@ tables = [
     "https://cdn.humanatlas.io/digital-objects/asct-b/uterus/v1.2/assets/ASCT-B_VH_Uterus.csv",
 ]
 
+# The upstream list repeats a few tables; drop duplicates, keeping order
+tables = list(dict.fromkeys(tables))
+
 
 class Command(BaseCommand):
     help = "Import Human Reference Data (ASCT+B) tables"
 
     def handle(self, *args, **options):
-        for table_url in tables:
-            print(table_url)
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
 
-            path = download_file(table_url)
-            asct_table_iterator = parse_asct_table(path)
+        # Fetch every table up front on a thread pool so downloads overlap
+        # with parsing/ingest of the preceding tables; one future per
+        # unique URL so the same file is never written concurrently
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                url: pool.submit(download_file, url, session=session)
+                for url in dict.fromkeys(tables)
+            }
 
-            for _, row in tqdm(asct_table_iterator, desc=table_url.split("/")[-1]):
-                as_id = row.get("AS/1/ID").replace("_", ":")
-                as_name = row.get("AS/1").lower()
+            for table_url in tables:
+                print(table_url)
 
-                ct_id = row.get("CT/1/ID").replace("_", ":")
-                ct_name = row.get("CT/1").lower()
+                path = futures[table_url].result()
+                asct_table = parse_asct_table(path)
 
-                if not all([as_id, as_name, ct_id, ct_name]):
-                    continue
+                # Vectorized normalization instead of str.replace/lower per row
+                as_ids = asct_table["AS/1/ID"].str.replace("_", ":", regex=False)
+                as_names = asct_table["AS/1"].str.lower()
+                ct_ids = asct_table["CT/1/ID"].str.replace("_", ":", regex=False)
+                ct_names = asct_table["CT/1"].str.lower()
 
-                ans, _ = AnatomicalStructure.objects.get_or_create(
-                    obo_id=as_id, defaults={"label": as_name}
+                valid = (
+                    as_ids.astype(bool)
+                    & as_names.astype(bool)
+                    & ct_ids.astype(bool)
+                    & ct_names.astype(bool)
                 )
-                clt, _ = CellType.objects.get_or_create(
-                    obo_id=ct_id, defaults={"label": ct_name}
+
+                # Collect unique terms and links; per-row get_or_create issued
+                # three queries per CSV row
+                structures = {}
+                cell_types = {}
+                links = set()
+
+                rows = zip(
+                    as_ids[valid], as_names[valid], ct_ids[valid], ct_names[valid]
+                )
+                for as_id, as_name, ct_id, ct_name in tqdm(
+                    rows, desc=table_url.split("/")[-1]
+                ):
+                    structures.setdefault(as_id, as_name)
+                    cell_types.setdefault(ct_id, ct_name)
+                    links.add((ct_id, as_id))
+
+                as_by_id = self._bulk_upsert(AnatomicalStructure, structures)
+                ct_by_id = self._bulk_upsert(CellType, cell_types)
+
+                # One insert for every cell type <-> structure link; existing
+                # rows are skipped by the conflict target
+                through = CellType.anatomical_structure.through
+                through.objects.bulk_create(
+                    [
+                        through(
+                            celltype_id=ct_by_id[ct_id].pk,
+                            anatomicalstructure_id=as_by_id[as_id].pk,
+                        )
+                        for ct_id, as_id in links
+                        if ct_id in ct_by_id and as_id in as_by_id
+                    ],
+                    ignore_conflicts=True,
                 )
-                try:
-                    clt.anatomical_structure.add(ans)
-                except ValueError:
-                    continue
-            delete_temp_dir()
+
+        # Downloads may still be in flight mid-loop; clean up once at the end
+        delete_temp_dir()
+
+    @staticmethod
+    def _bulk_upsert(model, terms: dict) -> dict:
+        """Insert missing terms in one query; returns obo_id -> instance.
+
+        Existing terms keep their (OLS-enriched) labels untouched, matching
+        the old get_or_create defaults semantics.
+        """
+        existing = set(
+            model.objects.filter(obo_id__in=terms).values_list("obo_id", flat=True)
+        )
+        model.objects.bulk_create(
+            [
+                model(obo_id=obo_id, label=label)
+                for obo_id, label in terms.items()
+                if obo_id not in existing
+            ],
+            ignore_conflicts=True,
+        )
+
+        instances = model.objects.in_bulk(list(terms), field_name="obo_id")
+
+        # bulk_create skips post_save, so queue the OLS enrichment for the
+        # new terms directly — batched, instead of one task per term
+        # (unknown ids are pruned by the task, cascading to any links
+        # created below)
+        new_pks = [
+            instance.pk
+            for obo_id in terms.keys() - existing
+            if (instance := instances.get(obo_id)) is not None
+        ]
+        for start in range(0, len(new_pks), 200):
+            fetch_ontology_data_batch_task.delay_on_commit(
+                model._meta.app_label,
+                model._meta.model_name,
+                new_pks[start : start + 200],
+            )
+
+        return instances
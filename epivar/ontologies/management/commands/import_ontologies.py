@@ -7,6 +7,7 @@ print(apps.get_app_config("ontologies").path)
 
 from django.core.management.base import BaseCommand
 from ontologies.models import Term, TermCategory
+from ontologies.tasks import fetch_ontology_data_batch_task
 
 
 class Command(BaseCommand):
@@ -22,7 +23,7 @@ class Command(BaseCommand):
         with open(file_path, "r") as handle:
             ontologies = json.load(handle)
 
-        categories = set([key.upper() for key in ontologies.keys()])
+        categories = {key.upper() for key in ontologies}
         unmatched_categories = categories.difference(set(TermCategory._member_names_))
         if unmatched_categories:
             assert (
@@ -30,9 +31,33 @@ class Command(BaseCommand):
             ), f"Declared category(ies) {unmatched_categories} not found in DB"
 
         for category, records in ontologies.items():
-            for record in tqdm(set(records), desc=category):
-                if Term.objects.filter(obo_id=record).first():
-                    continue
-
-                instance = Term(obo_id=record, category=category)
-                instance.save()
+            records = set(records)
+
+            # One existence query per category instead of one per record
+            existing = set(
+                Term.objects.filter(obo_id__in=records).values_list(
+                    "obo_id", flat=True
+                )
+            )
+
+            to_create = [
+                Term(obo_id=record, category=category)
+                for record in records - existing
+            ]
+            Term.objects.bulk_create(
+                to_create, ignore_conflicts=True, batch_size=1000
+            )
+
+            # bulk_create skips post_save, so queue the OLS enrichment for
+            # the new terms directly — batched, instead of one task per
+            # term (unknown ids are pruned by the task)
+            created = Term.objects.in_bulk(
+                [term.obo_id for term in to_create], field_name="obo_id"
+            )
+            new_pks = [instance.pk for instance in created.values()]
+            for start in tqdm(range(0, len(new_pks), 200), desc=category):
+                fetch_ontology_data_batch_task.delay_on_commit(
+                    Term._meta.app_label,
+                    Term._meta.model_name,
+                    new_pks[start : start + 200],
+                )
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ontologies', '0002_alter_anatomicalstructure_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['category', 'obo_id'], name='term_category_obo_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='term',
+            constraint=models.UniqueConstraint(fields=('category', 'obo_id'), name='term_cat_obo_uniq'),
+        ),
+    ]
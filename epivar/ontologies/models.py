@@ -68,3 +68,14 @@ class Term(Ontology):
     class Meta:
         verbose_name_plural = "Experiment Terms"
         ordering = ["label"]
+        # The importers look terms up by (category, obo_id); the composite
+        # b-tree serves those as index-only scans and gives bulk_create a
+        # proper conflict target
+        indexes = [
+            models.Index(fields=["category", "obo_id"], name="term_category_obo_idx")
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "obo_id"], name="term_cat_obo_uniq"
+            )
+        ]
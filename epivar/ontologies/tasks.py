@@ -0,0 +1,142 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from celery import shared_task
+from django.apps import apps
+
+logger = logging.getLogger(__name__)
+
+# In-flight OLS requests per batch task; the API tolerates this fan-out
+_MAX_CONNECTIONS = 20
+
+_ENRICHED_FIELDS = ["iri", "label", "synonyms", "description", "ontology_name"]
+
+
+def _fetch_term(obo_id, session=None):
+    """Fetch one term from the EBI OLS API.
+
+    Returns the raw OLS record, or None when OLS does not know the id.
+    Raises requests.HTTPError on a non-200 response and other
+    requests.RequestException subclasses on transport errors.
+    """
+    url = f"https://www.ebi.ac.uk/ols4/api/terms/findByIdAndIsDefiningOntology?id={obo_id}&lang=en"
+
+    response = (session or requests).get(url, timeout=30)
+    response.raise_for_status()
+
+    data = response.json()
+    if data.get("page", {}).get("totalElements", 0) == 0:
+        return None
+
+    return data["_embedded"]["terms"][0]
+
+
+def _apply_term(instance, term):
+    instance.iri = term.get("iri")
+    instance.label = term.get("label")
+    instance.synonyms = " | ".join(term.get("synonyms") or [])
+    instance.description = " | ".join(term.get("description") or [])
+    instance.ontology_name = term.get("ontology_name")
+
+
+@shared_task(bind=True, max_retries=3)
+def fetch_ontology_data_task(self, app_label, model_name, pk):
+    """
+    Celery task: enrich an ontology term from the EBI OLS API.
+
+    Terms OLS does not know are deleted, mirroring the old synchronous
+    signal behaviour. Network errors retry with a short backoff.
+    """
+    Model = apps.get_model(app_label, model_name)
+    instance = Model.objects.filter(pk=pk).first()
+    if instance is None:
+        return f"{model_name}({pk}) no longer exists"
+
+    obo_id = instance.obo_id
+
+    try:
+        term = _fetch_term(obo_id)
+    except requests.HTTPError as exc:
+        logger.error(f"Failed to fetch term {obo_id}: {exc}")
+        return f"Failed to fetch term {obo_id}"
+    except requests.RequestException as exc:
+        raise self.retry(exc=exc, countdown=10)
+
+    if term is None:
+        instance.delete()
+        logger.error(f"Term {obo_id} not found; removed")
+        return f"Term {obo_id} not found"
+
+    _apply_term(instance, term)
+    Model.objects.filter(pk=pk).update(
+        **{field: getattr(instance, field) for field in _ENRICHED_FIELDS}
+    )
+
+    logger.info(f"Term {obo_id} updated successfully")
+    return f"Term {obo_id} updated"
+
+
+@shared_task(bind=True, max_retries=3)
+def fetch_ontology_data_batch_task(self, app_label, model_name, pks):
+    """
+    Celery task: enrich a batch of ontology terms from the EBI OLS API.
+
+    Bulk importers queue this instead of one task per term: the requests
+    share a pooled session and run _MAX_CONNECTIONS at a time, unknown
+    terms are removed with one DELETE, and the enriched fields land in a
+    single bulk_update instead of one UPDATE per term.
+    """
+    Model = apps.get_model(app_label, model_name)
+    instances = list(Model.objects.filter(pk__in=pks))
+    if not instances:
+        return f"No {model_name} rows left to enrich"
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=_MAX_CONNECTIONS, pool_maxsize=_MAX_CONNECTIONS),
+    )
+
+    with ThreadPoolExecutor(max_workers=_MAX_CONNECTIONS) as pool:
+        futures = {
+            pool.submit(_fetch_term, instance.obo_id, session): instance
+            for instance in instances
+        }
+
+    enriched = []
+    missing_pks = []
+    transient = None
+
+    for future, instance in futures.items():
+        try:
+            term = future.result()
+        except requests.HTTPError as exc:
+            logger.error(f"Failed to fetch term {instance.obo_id}: {exc}")
+            continue
+        except requests.RequestException as exc:
+            transient = exc
+            continue
+
+        if term is None:
+            missing_pks.append(instance.pk)
+            logger.error(f"Term {instance.obo_id} not found; removed")
+        else:
+            _apply_term(instance, term)
+            enriched.append(instance)
+
+    if transient is not None and not enriched and not missing_pks:
+        # Nothing got through at all — looks like an outage, retry whole
+        raise self.retry(exc=transient, countdown=10)
+
+    if missing_pks:
+        Model.objects.filter(pk__in=missing_pks).delete()
+
+    if enriched:
+        Model.objects.bulk_update(enriched, fields=_ENRICHED_FIELDS, batch_size=200)
+
+    return (
+        f"Enriched {len(enriched)} of {len(instances)} {model_name} term(s), "
+        f"removed {len(missing_pks)}"
+    )
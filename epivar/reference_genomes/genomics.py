@@ -1,10 +1,11 @@
+from itertools import groupby, islice
+from operator import itemgetter
 from os.path import join
 from pathlib import Path
 
 import pysam
 from pybedtools import BedTool
 from liftover import ChainFile
-from pybedtools import Interval
 from datasets.models import DataTypes
 
 
@@ -25,10 +26,9 @@ def sort_index_bgzip(file: str | Path, preset: str) -> tuple[Path, Path]:
     return sorted_gzp_path, index_path
 
 
-def _lift_over_interval(feature: Interval, converter: ChainFile) -> str | None:
-    chrom, start, end = str(feature[0]), int(feature[1]), int(feature[2])
-    start = converter[chrom][start]
-    end = converter[chrom][end]
+def _lift_over_interval(feature: list, chrom_map) -> bytes | None:
+    start = chrom_map[int(feature[1])]
+    end = chrom_map[int(feature[2])]
 
     if start and end:
         new_chr_1, new_chr_2 = start[0][0], end[0][0]
@@ -38,24 +38,21 @@ def _lift_over_interval(feature: Interval, converter: ChainFile) -> str | None:
             new_end = end[0][1]
 
             if new_start <= new_end:
-                feature[0] = new_chr_1.replace("chr", "")
-                feature[1] = new_start
-                feature[2] = new_end
+                feature[0] = new_chr_1.replace("chr", "").encode()
+                feature[1] = b"%d" % new_start
+                feature[2] = b"%d" % new_end
 
-                return "\t".join([str(e) for e in feature])
+                return b"\t".join(feature)
 
     return None
 
 
-def _lift_over_pair(feature: list, converter: "ChainFile") -> str | None:
-    chrom1, start1, end1 = str(feature[0]), int(feature[1]), int(feature[2])
-    chrom2, start2, end2 = str(feature[3]), int(feature[4]), int(feature[5])
+def _lift_over_pair(feature: list, chrom_map_1, chrom_map_2) -> bytes | None:
+    lifted_start1 = chrom_map_1[int(feature[1])]
+    lifted_end1 = chrom_map_1[int(feature[2])]
 
-    lifted_start1 = converter[chrom1][start1]
-    lifted_end1 = converter[chrom1][end1]
-
-    lifted_start2 = converter[chrom2][start2]
-    lifted_end2 = converter[chrom2][end2]
+    lifted_start2 = chrom_map_2[int(feature[4])]
+    lifted_end2 = chrom_map_2[int(feature[5])]
 
     if lifted_start1 and lifted_end1 and lifted_start2 and lifted_end2:
         new_chr1 = lifted_start1[0][0]
@@ -68,42 +65,74 @@ def _lift_over_pair(feature: list, converter: "ChainFile") -> str | None:
 
         # Only keep if both intervals stay on the same chromosome
         if new_start1 <= new_end1 and new_start2 <= new_end2:
-            feature[0] = new_chr1.replace("chr", "")
-            feature[1] = new_start1
-            feature[2] = new_end1
-            feature[3] = new_chr2.replace("chr", "")
-            feature[4] = new_start2
-            feature[5] = new_end2
+            feature[0] = new_chr1.replace("chr", "").encode()
+            feature[1] = b"%d" % new_start1
+            feature[2] = b"%d" % new_end1
+            feature[3] = new_chr2.replace("chr", "").encode()
+            feature[4] = b"%d" % new_start2
+            feature[5] = b"%d" % new_end2
 
-            return "\t".join(str(e) for e in feature)
+            return b"\t".join(feature)
 
     return None
 
 
+# Rows buffered per read/write cycle; one BGZF write per batch instead of
+# one per line keeps the compressor fed with large blocks
+_BATCH_SIZE = 64 * 1024
+
+
+def _iter_batches(handle, batch_size=_BATCH_SIZE):
+    batch = list(islice(handle, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(handle, batch_size))
+
+
 def lift_over(
     file_in: str | Path, file_out: str | Path, chain_file_path: str | Path, data_type
 ) -> None:
     converter = ChainFile(chain_file_path)
 
-    if data_type == DataTypes.bed:
-        _func = _lift_over_interval
-    elif data_type == DataTypes.bedpe:
-        _func = _lift_over_pair
-    else:
+    if data_type not in (DataTypes.bed, DataTypes.bedpe):
         raise ValueError(f"Unsupported file type {data_type}")
 
     with pysam.BGZFile(file_in, "r") as fin, pysam.BGZFile(file_out, "w") as fout:
-        for raw_line in fin:
-            line = raw_line.decode()  # BGZFile returns bytes, need to decode to str
-            if line.startswith("#"):
-                fout.write((line + "\n").encode())
+        for raw_batch in _iter_batches(fin):
+            out_lines = []
+            rows = []
+
+            # BGZFile yields bytes; keep them raw — only the chromosome
+            # names ever need to become str, once per sorted group
+            for raw_line in raw_batch:
+                if raw_line.startswith(b"#"):
+                    out_lines.append(raw_line + b"\n")
+
+                else:
+                    rows.append(raw_line.rstrip().split(b"\t"))
+
+            # Sorting groups the batch by chromosome, so the chain map for
+            # each chromosome is resolved once per group instead of per row
+            if data_type == DataTypes.bed:
+                rows.sort(key=itemgetter(0))
+                for chrom, group in groupby(rows, key=itemgetter(0)):
+                    chrom_map = converter[chrom.decode()]
+                    for feature in group:
+                        lifted = _lift_over_interval(feature, chrom_map)
+                        if lifted:
+                            out_lines.append(lifted + b"\n")
 
             else:
-                fields = line.rstrip().split("\t")
-                lifted = _func(fields, converter)
-
-                if lifted:
-                    fout.write((str(lifted) + "\n").encode())
+                rows.sort(key=itemgetter(0, 3))
+                for (chrom1, chrom2), group in groupby(rows, key=itemgetter(0, 3)):
+                    chrom_map_1 = converter[chrom1.decode()]
+                    chrom_map_2 = converter[chrom2.decode()]
+                    for feature in group:
+                        lifted = _lift_over_pair(feature, chrom_map_1, chrom_map_2)
+                        if lifted:
+                            out_lines.append(lifted + b"\n")
+
+            fout.write(b"".join(out_lines))
 
 
 def lift_over_metrics(file_in: str | Path, file_out: str | Path) -> dict:
@@ -1,10 +1,50 @@
+import gzip
+import json
 import os
 import sys
+import threading
 
 import shutil
 import requests
+import pandas as pd
 from pathlib import Path
 
+from django.core.files import File
+
+
+class LargeChunkFile(File):
+    """django File copied in 4 MiB chunks instead of the default 64 KiB.
+
+    FileSystemStorage streams uploads through File.chunks(); the default
+    chunk size turns a multi-MB .bed.gz save into hundreds of small
+    read/write syscall pairs.
+    """
+
+    DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Download manifest: url -> {status_code, etag, size}; lets re-runs skip
+# files the server still serves unchanged (If-None-Match -> 304) and stop
+# re-probing URLs that 404ed. Guarded by a lock — downloads may run on a
+# thread pool
+_MANIFEST_NAME = "manifest.json"
+_manifest_lock = threading.Lock()
+
+
+def _load_manifest(save_dir) -> dict:
+    try:
+        with open(os.path.join(save_dir, _MANIFEST_NAME)) as handle:
+            return json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _update_manifest(save_dir, url, entry):
+    with _manifest_lock:
+        manifest = _load_manifest(save_dir)
+        manifest[url] = entry
+        with open(os.path.join(save_dir, _MANIFEST_NAME), "w") as handle:
+            json.dump(manifest, handle)
+
 
 def delete_temp_dir(path="temp/"):
     if os.path.isdir(path):
@@ -14,7 +54,9 @@ def delete_temp_dir(path="temp/"):
         print(f"Directory does not exist: {path}")
 
 
-def download_file(url, save_dir="temp/", filename=None) -> Path | None:
+def download_file(
+    url, save_dir="temp/", filename=None, hasher=None, session=None
+) -> Path | None:
     """
     Downloads a file from a URL and saves it to a specified directory.
 
@@ -22,6 +64,11 @@ def download_file(url, save_dir="temp/", filename=None) -> Path | None:
         url (str): The URL to download the file from.
         save_dir (str): The directory to save the downloaded file.
         filename (str, optional): The name to save the file as. If not provided, the name is extracted from the URL.
+        hasher (optional): A hashlib object updated with every chunk, so a
+            checksum comes out of the download pass instead of re-reading
+            the file from disk afterwards.
+        session (optional): A requests.Session to reuse connections across
+            downloads, e.g. when fetching many files from one host.
 
     Returns:
         Path: Full path to the saved file.
@@ -36,14 +83,110 @@ def download_file(url, save_dir="temp/", filename=None) -> Path | None:
     # Full path for saving the file
     file_path = os.path.join(save_dir, filename)
 
+    with _manifest_lock:
+        entry = _load_manifest(save_dir).get(url, {})
+
+    # Negative cache: don't re-probe URLs that are known to 404
+    if entry.get("status_code") == 404:
+        raise requests.HTTPError(f"404 Not Found (cached) for url: {url}")
+
+    headers = {}
+    if entry.get("etag") and os.path.exists(file_path):
+        headers["If-None-Match"] = entry["etag"]
+
     # Download the file
-    response = requests.get(url, stream=True)
+    response = (session or requests).get(url, stream=True, headers=headers)
+
+    # Unchanged on the server — reuse the copy on disk
+    if response.status_code == 304:
+        print(f"File unchanged, reusing: {file_path}")
+        if hasher is not None:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+        return Path(file_path)
+
+    if response.status_code == 404:
+        _update_manifest(save_dir, url, {"status_code": 404})
+
     response.raise_for_status()  # Raise an error on bad status
 
-    # Write to file
+    # Write to file; 1 MiB chunks keep the Python-level loop negligible
     with open(file_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
+            if hasher is not None:
+                hasher.update(chunk)
             f.write(chunk)
 
+    _update_manifest(
+        save_dir,
+        url,
+        {
+            "status_code": 200,
+            "etag": response.headers.get("ETag"),
+            "size": os.path.getsize(file_path),
+        },
+    )
+
     print(f"File downloaded and saved to: {file_path}")
     return Path(file_path)
+
+
+def read_bed_frame(path, names, usecols=(0, 1, 2, 3), dtype=None) -> pd.DataFrame:
+    """
+    Parse a (possibly gzipped) BED file into a DataFrame.
+
+    pandas' C parser replaces the per-line split loops the importers used,
+    amortizing the interpreter cost across millions of rows.
+
+    Args:
+        path: BED file, plain or gzip-compressed (by extension).
+        names: Column names assigned to the selected columns, in order.
+        usecols: Column indices to keep; negative indices count from the
+            last column of the file.
+        dtype (dict, optional): Column name -> dtype mapping.
+
+    Returns:
+        pd.DataFrame: The selected columns, named after `names`. Leading
+        comment/track/header lines are skipped.
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+
+    # Sniff past comment/track/header lines and count the data columns so
+    # negative usecols indices can be resolved
+    skiprows = 0
+    n_fields = None
+    with opener(path, "rt") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if (
+                not stripped
+                or stripped.startswith("#")
+                or stripped.startswith("track")
+                or stripped.lower().startswith("chrom")
+            ):
+                skiprows += 1
+            else:
+                n_fields = len(line.rstrip("\n").split("\t"))
+                break
+
+    if n_fields is None:
+        return pd.DataFrame(columns=list(names))
+
+    columns = [index % n_fields for index in usecols]
+    frame = pd.read_csv(
+        path,
+        sep="\t",
+        header=None,
+        skiprows=skiprows,
+        usecols=columns,
+        dtype=(
+            {column: dtype[name] for column, name in zip(columns, names)}
+            if dtype
+            else None
+        ),
+    )
+
+    frame = frame[columns]
+    frame.columns = list(names)
+    return frame
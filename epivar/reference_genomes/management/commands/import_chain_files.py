@@ -1,11 +1,15 @@
 import sys
 
-from django.core.files import File
 from django.core.management.base import BaseCommand
 from django.core.exceptions import ObjectDoesNotExist
 
-from reference_genomes.models import Assembly, ReferenceGenome, ChainFile
-from ._private import download_file, delete_temp_dir
+from reference_genomes.models import (
+    Assembly,
+    ReferenceGenome,
+    ChainFile,
+    checksum_hasher,
+)
+from ._private import LargeChunkFile, download_file, delete_temp_dir
 
 chain_files = [
     {
@@ -64,11 +68,15 @@ class Command(BaseCommand):
             except ObjectDoesNotExist:
                 instance = ChainFile(source_genome=source, target_genome=target)
 
-                chain_file_path = download_file(record["file"])
+                # Hash during the download so save() does not re-read the
+                # whole chain file from disk
+                digest = checksum_hasher()
+                chain_file_path = download_file(record["file"], hasher=digest)
                 with open(chain_file_path, "rb") as chain_file:
                     instance.file.save(
-                        chain_file_path.name, File(chain_file), save=False
+                        chain_file_path.name, LargeChunkFile(chain_file), save=False
                     )
+                    instance.file_checksum = digest.hexdigest()
                     instance.save()
 
         delete_temp_dir()
@@ -1,21 +1,23 @@
 import os
 import re
-import shutil
 import tempfile
-import gzip
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pysam
+import requests
+import pandas as pd
+from requests.adapters import HTTPAdapter
 
-from django.core.files import File
 from django.core.management.base import BaseCommand, CommandError
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from pybedtools import BedTool
 
 from reference_genomes.models import (
+    DigestingFile,
     GenomicFeature,
     GenomicFeatureCollection,
     ReferenceGenome,
 )
-from ._private import download_file
+from ._private import download_file, read_bed_frame
 
 
 # Add this near your STATE_MAP
@@ -211,6 +213,39 @@ BASE_URL = (
 )
 
 
+def _tabix_state(eid, safe_state, sub, tmpdir):
+    """Write, sort and tabix one per-state BED.
+
+    Top-level so it can run on a process pool worker; pure file work, no
+    ORM access. Returns the (bed_gz, bed_tbi) paths inside `tmpdir`.
+
+    The frame is sorted in pandas and compressed/indexed through pysam
+    directly: no unix-sort/bgzip subprocesses, and a libdeflate-linked
+    htslib roughly doubles the bgzip throughput over zlib.
+    """
+    bed_gz = os.path.join(tmpdir, f"{eid}_{safe_state}.bed.gz")
+    bed_tbi = bed_gz + ".tbi"
+
+    # Write straight through BGZF — the uncompressed intermediate BED
+    # existed only to be re-read by tabix_compress
+    with pysam.BGZFile(bed_gz, "wb") as bgz:
+        bgz.write(b"#chrom\tstart\tend\tname\n")
+        bgz.write(
+            sub.sort_values(["chrom", "start"])
+            .to_csv(
+                sep="\t",
+                header=False,
+                index=False,
+                columns=["chrom", "start", "end", "state"],
+            )
+            .encode()
+        )
+
+    pysam.tabix_index(bed_gz, preset="bed", force=True)
+
+    return bed_gz, bed_tbi
+
+
 class Command(BaseCommand):
     help = "Download, normalize, and import roadmap segmentations into per-state GenomicFeatures grouped by Collection"
 
@@ -227,75 +262,131 @@ class Command(BaseCommand):
         except ObjectDoesNotExist:
             raise CommandError("ReferenceGenome hg38 not found. Import genomes first.")
 
-        for eid, cell_name in CELL_TYPE_MAP.items():
-            for model_key, cfg in MODEL_CONFIGS.items():
-                fname = cfg["fname_template"].format(eid=eid)
+        # The old per-state validation intersected every BED against the
+        # chrom sizes with pybedtools — three full passes per state. The
+        # check only ever catches off-assembly chromosome names, so one
+        # set diff per downloaded file against this cached set is enough
+        chromsize_chroms = set(
+            pd.read_csv(
+                reference_genome.chrom_size_file_bed.path,
+                sep="\t",
+                header=None,
+                usecols=[0],
+                dtype="string",
+            )[0]
+        )
 
-                url = cfg["base_url"] + fname
-                self.stdout.write(f"Processing {eid} ({cell_name}) with {model_key}")
+        # One query for all existing feature names; the per-state
+        # existence checks below become set lookups
+        existing_names = set(GenomicFeature.objects.values_list("name", flat=True))
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+        # 1. Queue all ~250 downloads on a thread pool up front so they
+        # overlap with the per-EID split/tabix/import work below; each
+        # (eid, model) pair has a distinct filename, so no write races.
+        # Sort/bgzip per state is CPU-bound and independent, so those run
+        # on a process pool sized to the machine
+        with (
+            ThreadPoolExecutor(max_workers=16) as pool,
+            ProcessPoolExecutor(max_workers=os.cpu_count()) as tabix_pool,
+        ):
+            downloads = {
+                (eid, model_key): pool.submit(
+                    download_file,
+                    cfg["base_url"] + cfg["fname_template"].format(eid=eid),
+                    session=session,
+                )
+                for eid in CELL_TYPE_MAP
+                for model_key, cfg in MODEL_CONFIGS.items()
+            }
 
-                # 1. Download
-                try:
-                    file_path = download_file(url)
-                    file_path = str(file_path)
-                except Exception as e:
-                    # Skip if file is not found (e.g., 404)
+            for eid, cell_name in CELL_TYPE_MAP.items():
+                for model_key, cfg in MODEL_CONFIGS.items():
                     self.stdout.write(
-                        self.style.WARNING(
-                            f"Skipping {eid} ({cell_name}) {model_key}: {e}"
-                        )
+                        f"Processing {eid} ({cell_name}) with {model_key}"
                     )
-                    continue
-
-                # 2. Split into per-state records
-                state_records = defaultdict(list)
-                with gzip.open(file_path, "rt") as infile:
-                    for line in infile:
-                        if (
-                            line.startswith("#")
-                            or line.startswith("track")
-                            or line.strip() == ""
-                        ):
-                            continue
-                        parts = line.rstrip("\n").split("\t")
-                        if parts[0].startswith("chr"):
-                            parts[0] = parts[0][3:]
-
-                        state_no = parts[3]  # just the number in stateno format
-                        state_name = cfg["state_map"].get(state_no, f"State{state_no}")
-
-                        state_records[state_name].append(
-                            "\t".join([parts[0], parts[1], parts[2], state_name])
+
+                    try:
+                        file_path = str(downloads[(eid, model_key)].result())
+                    except Exception as e:
+                        # Skip if file is not found (e.g., 404)
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f"Skipping {eid} ({cell_name}) {model_key}: {e}"
+                            )
                         )
+                        continue
+
+                    # 2. Split into per-state frames; pandas' C parser replaces
+                    # the per-line split loop, and with chrom/state as
+                    # categoricals the chr-prefix strip and state mapping touch
+                    # each distinct value once instead of every row
+                    bed = read_bed_frame(
+                        file_path,
+                        names=("chrom", "start", "end", "state_no"),
+                        dtype={
+                            "chrom": "category",
+                            # int32 halves the resident frame; hg38
+                            # coordinates stay well under 2**31
+                            "start": "int32",
+                            "end": "int32",
+                            "state_no": "category",
+                        },
+                    )
 
-                # 3. Create/get collection
-                collection_name = f"{cell_name} - {cfg['reference']}"
-                collection, _ = GenomicFeatureCollection.objects.get_or_create(
-                    name=collection_name,
-                    defaults={
-                        "description": f"Roadmap {cfg['reference']} segmentations for {cell_name}",
-                        "reference_genome": reference_genome,
-                        "reference": cfg["reference"],
-                        "reference_url": cfg["reference_url"],
-                    },
-                )
+                    bed["chrom"] = bed["chrom"].cat.rename_categories(
+                        lambda chrom: chrom.removeprefix("chr")
+                    )
+                    bed["state"] = bed["state_no"].cat.rename_categories(
+                        lambda state_no: cfg["state_map"].get(
+                            state_no, f"State{state_no}"
+                        )
+                    )
 
-                # 4. For each state, create or update GenomicFeature
-                for state, lines in state_records.items():
-                    feature_name = f"{cell_name} - {state}"
+                    unknown = set(bed["chrom"].cat.categories) - chromsize_chroms
+                    if unknown:
+                        raise ValidationError(
+                            f"File {file_path} does not match "
+                            f"{reference_genome.name}: unknown chromosomes "
+                            f"{sorted(unknown)}"
+                        )
 
-                    try:
-                        feature = GenomicFeature.objects.get(name=feature_name)
-                        if not force:
-                            self.stdout.write(
-                                f"{feature.name} already exists, skipping ..."
-                            )
-                            continue
-                        else:
-                            self.stdout.write(f"{feature.name} exists, overwriting ...")
+                    state_records = {
+                        state: sub
+                        for state, sub in bed.groupby("state", sort=False, observed=True)
+                    }
+
+                    # 3. Create/get collection
+                    collection_name = f"{cell_name} - {cfg['reference']}"
+                    collection, _ = GenomicFeatureCollection.objects.get_or_create(
+                        name=collection_name,
+                        defaults={
+                            "description": f"Roadmap {cfg['reference']} segmentations for {cell_name}",
+                            "reference_genome": reference_genome,
+                            "reference": cfg["reference"],
+                            "reference_url": cfg["reference_url"],
+                        },
+                    )
 
-                    except ObjectDoesNotExist:
-                        feature = GenomicFeature(
+                    # 4. For each state, create or update GenomicFeature;
+                    # existence comes from the preloaded name set instead
+                    # of one SELECT per state, then the CPU-bound
+                    # sort/tabix fans out across cores
+                    pending = {}
+                    for state in state_records:
+                        feature_name = f"{cell_name} - {state}"
+
+                        if feature_name in existing_names:
+                            if not force:
+                                self.stdout.write(
+                                    f"{feature_name} already exists, skipping ..."
+                                )
+                                continue
+                            self.stdout.write(f"{feature_name} exists, overwriting ...")
+
+                        pending[state] = GenomicFeature(
                             name=feature_name,
                             description=f"Roadmap {cfg['reference']} {state} segmentation for {cell_name}",
                             reference_genome=reference_genome,
@@ -303,49 +394,69 @@ class Command(BaseCommand):
                         )
 
                     with tempfile.TemporaryDirectory() as td:
-                        safe_state = re.sub(r"[^A-Za-z0-9._-]", "_", state)
-                        bed_file = os.path.join(td, f"{eid}_{safe_state}.bed")
-
-                        with open(bed_file, "w") as out:
-                            out.write("#chrom\tstart\tend\tname\n")
-                            out.write("\n".join(lines) + "\n")
-
-                        features_bt = BedTool(bed_file)
-                        chromsizes_bt = BedTool(
-                            reference_genome.chrom_size_file_bed.path
-                        )
-
-                        intersection = features_bt.intersect(chromsizes_bt, u=True)
-                        if features_bt.count() < intersection.count():
-                            raise ValidationError(
-                                f"File {bed_file} does not match {reference_genome.name}"
+                        futures = {
+                            state: tabix_pool.submit(
+                                _tabix_state,
+                                eid,
+                                re.sub(r"[^A-Za-z0-9._-]", "_", state),
+                                state_records[state],
+                                td,
                             )
+                            for state in pending
+                        }
+
+                        # File saves and the ORM writes stay on the main
+                        # process
+                        imported = []
+                        for state, future in futures.items():
+                            feature = pending[state]
+                            bed_gz, bed_tbi = future.result()
+
+                            # DigestingFile hashes while the storage
+                            # streams the copy, so the checksums fall out
+                            # of the write instead of a second read pass
+                            with open(bed_gz, "rb") as s, open(bed_tbi, "rb") as i:
+                                bed_content = DigestingFile(s)
+                                tbi_content = DigestingFile(i)
+                                feature.file.save(
+                                    os.path.basename(bed_gz), bed_content, save=False
+                                )
+                                feature.file_index.save(
+                                    os.path.basename(bed_tbi), tbi_content, save=False
+                                )
+                                feature.file_checksum = bed_content.hexdigest()
+                                feature.file_index_checksum = tbi_content.hexdigest()
+
+                            feature.reference = cfg["reference"]
+                            feature.reference_url = cfg["reference_url"]
+                            feature.collection = collection
+                            imported.append(feature)
+
+                    # One multirow upsert per (EID, model) instead of a save
+                    # per state; checksums were already filled in above
+                    # since bulk_create skips the model's save()
+                    GenomicFeature.objects.bulk_create(
+                        imported,
+                        update_conflicts=True,
+                        unique_fields=["name"],
+                        update_fields=[
+                            "description",
+                            "reference",
+                            "reference_url",
+                            "collection",
+                            "reference_genome",
+                            "file",
+                            "file_index",
+                            "file_checksum",
+                            "file_index_checksum",
+                        ],
+                        batch_size=500,
+                    )
+                    existing_names.update(feature.name for feature in imported)
 
-                        self.stdout.write(f"Sorting + tabix {feature_name} ...")
-                        sorted_bt = BedTool(bed_file).sort(header=True)
-                        tabix_bt = sorted_bt.tabix(force=True, is_sorted=True)
-
-                        bed_gz = os.path.join(td, f"{eid}_{safe_state}.bed.gz")
-                        bed_tbi = bed_gz + ".tbi"
-
-                        shutil.move(tabix_bt.fn, bed_gz)
-                        shutil.move(tabix_bt.fn + ".tbi", bed_tbi)
-
-                        with open(bed_gz, "rb") as s, open(bed_tbi, "rb") as i:
-                            feature.file.save(
-                                os.path.basename(bed_gz), File(s), save=False
-                            )
-                            feature.file_index.save(
-                                os.path.basename(bed_tbi), File(i), save=False
+                    for feature in imported:
+                        self.stdout.write(
+                            self.style.SUCCESS(
+                                f"Imported {feature.name} into {collection.name}"
                             )
-
-                    feature.reference = cfg["reference"]
-                    feature.reference_url = cfg["reference_url"]
-                    feature.collection = collection
-                    feature.save()
-
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"Imported {feature.name} into {collection.name}"
                         )
-                    )
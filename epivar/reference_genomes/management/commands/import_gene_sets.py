@@ -3,8 +3,68 @@ from tqdm import tqdm
 import json
 
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from reference_genomes.models import GeneSet, GeneSetCollection
 
+try:
+    # ~3-6x faster than stdlib json on the hundreds-of-MB MSigDB dumps
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Columns streamed through COPY, in row order
+COPY_COLUMNS = (
+    "name",
+    "collection",
+    "subcollection",
+    "subset",
+    "exact_source",
+    "external_details_url",
+    "systematic_name",
+    "pmid",
+    "reference",
+    "reference_url",
+    "genes",
+)
+
+# NOT NULL CharFields on GeneSet; MSigDB omits these for some sets, and
+# the ORM path stores the Django default "" rather than NULL
+NOT_NULL_COLUMNS = frozenset({"name", "collection", "systematic_name"})
+
+# COPY text format: escape the delimiter, newlines and the escape
+# character itself inside values
+COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+class CopyBuffer:
+    """Minimal read()-only file object over an iterator of COPY lines.
+
+    psycopg2's copy_expert pulls data through file.read(size), so this
+    adapts the row generator without materializing the whole dump.
+    """
+
+    def __init__(self, lines):
+        self._lines = lines
+        self._leftover = b""
+
+    def read(self, size=-1):
+        chunks = [self._leftover]
+        total = len(self._leftover)
+        for line in self._lines:
+            chunks.append(line)
+            total += len(line)
+            if 0 <= size <= total:
+                break
+        data = b"".join(chunks)
+        if 0 <= size < len(data):
+            self._leftover = data[size:]
+            return data[:size]
+        self._leftover = b""
+        return data
+
 
 class Command(BaseCommand):
     help = "Import Human MSigDB Collections"
@@ -25,37 +85,102 @@ class Command(BaseCommand):
         json_files = [f for f in json_dir.glob("*.json") if "all" in f.name]
 
         for json_file in json_files:
-            with open(json_file, "r", encoding="utf-8") as f:
-                gene_sets = json.load(f)
-
-            for name, elements in tqdm(gene_sets.items()):
-                collection_parts = elements.get("collection", "").split(":")
-                gene_data = {
-                    "name": name,
-                    "collection": (
-                        collection_parts[0] if len(collection_parts) > 0 else None
-                    ),
-                    "subcollection": (
-                        collection_parts[1] if len(collection_parts) > 1 else None
-                    ),
-                    "subset": (
-                        collection_parts[2] if len(collection_parts) > 2 else None
-                    ),
-                    "systematic_name": elements.get("systematicName"),
-                    "pmid": elements.get("pmid"),
-                    "exact_source": elements.get("exactSource"),
-                    "external_details_url": elements.get("externalDetailsURL"),
-                    "reference": f"The Molecular Signatures Database (MSigDB)",
-                    "reference_url": elements.get("msigdbURL"),
-                    "genes": {"genes": elements.get("geneSymbols")},
-                }
+            if orjson is not None:
+                # orjson parses from bytes
+                with open(json_file, "rb") as f:
+                    gene_sets = orjson.loads(f.read())
+            else:
+                with open(json_file, "r", encoding="utf-8") as f:
+                    gene_sets = json.load(f)
+
+            records = [
+                self._gene_set_data(name, elements)
+                for name, elements in gene_sets.items()
+            ]
+
+            if connection.vendor == "postgresql":
+                self._copy_gene_sets(records)
+            else:
+                self._bulk_create_gene_sets(records)
+
+    @staticmethod
+    def _gene_set_data(name, elements) -> dict:
+        collection_parts = elements.get("collection", "").split(":")
+        return {
+            "name": name,
+            "collection": (
+                collection_parts[0] if len(collection_parts) > 0 else None
+            ),
+            "subcollection": (
+                collection_parts[1] if len(collection_parts) > 1 else None
+            ),
+            "subset": collection_parts[2] if len(collection_parts) > 2 else None,
+            "systematic_name": elements.get("systematicName"),
+            "pmid": elements.get("pmid"),
+            "exact_source": elements.get("exactSource"),
+            "external_details_url": elements.get("externalDetailsURL"),
+            "reference": f"The Molecular Signatures Database (MSigDB)",
+            "reference_url": elements.get("msigdbURL"),
+            "genes": {"genes": elements.get("geneSymbols")},
+        }
+
+    @classmethod
+    def _copy_gene_sets(cls, records):
+        """Stream new gene sets through Postgres COPY FROM STDIN.
+
+        COPY skips the ORM's per-instance parameter binding entirely, but
+        cannot ignore conflicts — so idempotency comes from preloading
+        the existing names (unique) in one query and filtering up front.
+        """
+        existing = set(GeneSet.objects.values_list("name", flat=True))
+
+        sql = (
+            f"COPY {GeneSet._meta.db_table} "
+            f"({', '.join(COPY_COLUMNS)}) FROM STDIN"
+        )
+
+        def lines():
+            for record in tqdm(records, mininterval=0.5, miniters=500):
+                if record["name"] in existing:
+                    continue
+                existing.add(record["name"])
+                yield cls._copy_line(record)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(sql, CopyBuffer(lines()))
+
+    @staticmethod
+    def _copy_line(record):
+        row = []
+        for column in COPY_COLUMNS:
+            value = record[column]
+            if column == "genes":
+                if orjson is not None:
+                    value = orjson.dumps(value).decode()
+                else:
+                    value = json.dumps(value)
+            if value is None:
+                row.append("" if column in NOT_NULL_COLUMNS else "\\N")
+            else:
+                row.append(str(value).translate(COPY_ESCAPES))
+        return ("\t".join(row) + "\n").encode()
 
+    @staticmethod
+    def _bulk_create_gene_sets(records):
+        # Buffer rows and bulk_create in batches of 1000 inside one
+        # transaction; ignore_conflicts keeps the idempotency — already-
+        # imported sets hit the unique constraints and are skipped
+        objs = []
+        with transaction.atomic():
+            for record in tqdm(records, mininterval=0.5, miniters=500):
                 # Remove None values to avoid passing unnecessary kwargs
-                gene_data_clean = {k: v for k, v in gene_data.items() if v is not None}
+                gene_data_clean = {k: v for k, v in record.items() if v is not None}
 
-                try:
-                    GeneSet.objects.get_or_create(**gene_data_clean)
+                objs.append(GeneSet(**gene_data_clean))
+                if len(objs) >= 1000:
+                    GeneSet.objects.bulk_create(
+                        objs, batch_size=1000, ignore_conflicts=True
+                    )
+                    objs.clear()
 
-                except Exception as e:
-                    print(e)
-                    print(gene_data_clean)
+            GeneSet.objects.bulk_create(objs, batch_size=1000, ignore_conflicts=True)
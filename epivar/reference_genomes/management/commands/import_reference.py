@@ -82,13 +82,10 @@ class Command(BaseCommand):
                 chrom_df = pd.read_table(chrom_size_path, header=None)
                 chrom_df.columns = ["#chrom", "end"]
 
-                # Normalize names: strip chr, fix M→MT
-                chrom_df["#chrom"] = chrom_df["#chrom"].str.replace(
-                    "^chr", "", regex=True
-                )
-                chrom_df["#chrom"] = chrom_df["#chrom"].str.replace(
-                    "M$", "MT", regex=True
-                )
+                # Normalize names: strip chr, fix M→MT; plain string ops,
+                # no regex engine needed
+                chrom_df["#chrom"] = chrom_df["#chrom"].str.removeprefix("chr")
+                chrom_df.loc[chrom_df["#chrom"].eq("M"), "#chrom"] = "MT"
 
                 # Save normalized chrom.sizes (2-column file)
                 norm_chrom_sizes = tmpdir / "chrom_sizes.txt"
@@ -1,20 +1,20 @@
 import os
 import re
-import shutil
 import tempfile
-from collections import defaultdict
 
-from django.core.files import File
+import pysam
+import pandas as pd
+
 from django.core.management.base import BaseCommand, CommandError
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from pybedtools import BedTool
 
 from reference_genomes.models import (
+    DigestingFile,
     GenomicFeature,
     GenomicFeatureCollection,
     ReferenceGenome,
 )
-from ._private import download_file
+from ._private import download_file, read_bed_frame
 
 
 features_data = [
@@ -72,92 +72,128 @@ class Command(BaseCommand):
             file_path = str(file_path)
 
             # ----------------------------
-            # 3. Split into per-label sets by last column
+            # 3. Split into per-label frames by last column; pandas' C
+            # parser replaces the per-line split loop, and categoricals
+            # make the chr-prefix strip touch each distinct value once
             # ----------------------------
-            label_records = defaultdict(list)
-            with open(file_path, "r") as infile:
-                for line in infile:
-                    if (
-                        line.startswith("#")
-                        or line.lower().startswith("chrom")
-                        or line.strip() == ""
-                    ):
-                        continue
-                    parts = line.rstrip("\n").split("\t")
-                    chrom, start, end = parts[0], parts[1], parts[2]
-                    label = parts[-1]
-
-                    if chrom.startswith("chr"):
-                        chrom = chrom[3:]
-
-                    label_records[label].append("\t".join([chrom, start, end, label]))
+            bed = read_bed_frame(
+                file_path,
+                names=("chrom", "start", "end", "label"),
+                usecols=(0, 1, 2, -1),
+                dtype={
+                    "chrom": "category",
+                    # int32 halves the resident frame; hg38 coordinates
+                    # stay well under 2**31
+                    "start": "int32",
+                    "end": "int32",
+                    "label": "category",
+                },
+            )
+
+            bed["chrom"] = bed["chrom"].cat.rename_categories(
+                lambda chrom: chrom.removeprefix("chr")
+            )
+
+            # Validate vs chrom.sizes once per file: the per-label
+            # pybedtools intersect cost three full passes per label and
+            # only ever caught off-assembly chromosome names
+            chromsize_chroms = set(
+                pd.read_csv(
+                    reference_genome.chrom_size_file_bed.path,
+                    sep="\t",
+                    header=None,
+                    usecols=[0],
+                    dtype="string",
+                )[0]
+            )
+            unknown = set(bed["chrom"].cat.categories) - chromsize_chroms
+            if unknown:
+                raise ValidationError(
+                    f"File {file_path} does not match "
+                    f"{reference_genome.name}: unknown chromosomes "
+                    f"{sorted(unknown)}"
+                )
+
+            label_records = {
+                label: sub
+                for label, sub in bed.groupby("label", sort=False, observed=True)
+            }
 
             # ----------------------------
             # 4. For each label, create/update GenomicFeature
             # ----------------------------
-            for label, lines in label_records.items():
-                feature_name = f"{record['name']} - {label}"
-
-                try:
-                    feature = GenomicFeature.objects.get(name=feature_name)
-                    if not force:
-                        self.stdout.write(
-                            f"{feature.name} already exists, skipping ..."
+            # One temp dir shared by every label — a fresh
+            # TemporaryDirectory per label only added mkdir/rmdir churn;
+            # the per-label filenames are already unique
+            with tempfile.TemporaryDirectory() as td:
+                for label, sub in label_records.items():
+                    feature_name = f"{record['name']} - {label}"
+
+                    try:
+                        feature = GenomicFeature.objects.get(name=feature_name)
+                        if not force:
+                            self.stdout.write(
+                                f"{feature.name} already exists, skipping ..."
+                            )
+                            continue
+                        else:
+                            self.stdout.write(f"{feature.name} exists, overwriting ...")
+                    except ObjectDoesNotExist:
+                        feature = GenomicFeature(
+                            name=feature_name,
+                            description=f"{record['description']} ({label})",
+                            reference_genome=reference_genome,
+                            collection=collection,
                         )
-                        continue
-                    else:
-                        self.stdout.write(f"{feature.name} exists, overwriting ...")
-                except ObjectDoesNotExist:
-                    feature = GenomicFeature(
-                        name=feature_name,
-                        description=f"{record['description']} ({label})",
-                        reference_genome=reference_genome,
-                        collection=collection,
-                    )
 
-                with tempfile.TemporaryDirectory() as td:
                     safe_label = re.sub(r"[^A-Za-z0-9._-]", "_", label)
-                    bed_file = os.path.join(td, f"{record['name']}_{safe_label}.bed")
-
-                    with open(bed_file, "w") as out:
-                        out.write("#chrom\tstart\tend\tname\n")
-                        out.write("\n".join(lines) + "\n")
-
-                    # Validate vs chrom.sizes
-                    features_bt = BedTool(bed_file)
-                    chromsizes_bt = BedTool(reference_genome.chrom_size_file_bed.path)
-                    intersection = features_bt.intersect(chromsizes_bt, u=True)
-                    if features_bt.count() < intersection.count():
-                        raise ValidationError(
-                            f"File {bed_file} does not match {reference_genome.name}"
-                        )
-
-                    # Sort + tabix
-                    self.stdout.write(f"Sorting + tabix {feature_name} ...")
-                    sorted_bt = BedTool(bed_file).sort(header=True)
-                    tabix_bt = sorted_bt.tabix(force=True, is_sorted=True)
 
+                    # Pre-sorted in pandas, written straight through BGZF
+                    # and indexed in place — no uncompressed intermediate
+                    # and no unix-sort/bgzip subprocesses
+                    self.stdout.write(f"Compressing + tabix {feature_name} ...")
                     bed_gz = os.path.join(td, f"{record['name']}_{safe_label}.bed.gz")
                     bed_tbi = bed_gz + ".tbi"
 
-                    shutil.move(tabix_bt.fn, bed_gz)
-                    shutil.move(tabix_bt.fn + ".tbi", bed_tbi)
+                    with pysam.BGZFile(bed_gz, "wb") as bgz:
+                        bgz.write(b"#chrom\tstart\tend\tname\n")
+                        bgz.write(
+                            sub.sort_values(["chrom", "start"])
+                            .to_csv(
+                                sep="\t",
+                                header=False,
+                                index=False,
+                                columns=["chrom", "start", "end", "label"],
+                            )
+                            .encode()
+                        )
 
+                    pysam.tabix_index(bed_gz, preset="bed", force=True)
+
+                    # DigestingFile hashes while the storage streams the
+                    # copy; save() sees the fresh checksums and skips its
+                    # own hashing pass
                     with open(bed_gz, "rb") as s, open(bed_tbi, "rb") as i:
-                        feature.file.save(os.path.basename(bed_gz), File(s), save=False)
+                        bed_content = DigestingFile(s)
+                        tbi_content = DigestingFile(i)
+                        feature.file.save(
+                            os.path.basename(bed_gz), bed_content, save=False
+                        )
                         feature.file_index.save(
-                            os.path.basename(bed_tbi), File(i), save=False
+                            os.path.basename(bed_tbi), tbi_content, save=False
                         )
+                        feature.file_checksum = bed_content.hexdigest()
+                        feature.file_index_checksum = tbi_content.hexdigest()
 
-                feature.reference = (
-                    "SCREEN: Search Candidate cis-Regulatory Elements by ENCODE v3"
-                )
-                feature.reference_url = "https://screen.encodeproject.org/"
-                feature.collection = collection
+                    feature.reference = (
+                        "SCREEN: Search Candidate cis-Regulatory Elements by ENCODE v3"
+                    )
+                    feature.reference_url = "https://screen.encodeproject.org/"
+                    feature.collection = collection
 
-                feature.save()
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Imported {feature.name} into {collection.name}"
+                    feature.save()
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Imported {feature.name} into {collection.name}"
+                        )
                     )
-                )
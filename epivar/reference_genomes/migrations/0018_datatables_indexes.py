@@ -0,0 +1,61 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "reference_genomes",
+            "0017_genomicfeaturecollection_genomicfeature_collection",
+        ),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="genomicfeature",
+            index=models.Index(
+                fields=["collection", "reference_genome"],
+                name="genomicfeature_coll_ref_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="genomicfeature",
+            index=GinIndex(
+                fields=["name"],
+                name="genomicfeature_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="genomicfeature",
+            index=GinIndex(
+                fields=["description"],
+                name="genomicfeature_desc_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="geneset",
+            index=models.Index(
+                fields=["collection", "subcollection"],
+                name="geneset_collection_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="geneset",
+            index=models.Index(
+                fields=["systematic_name"], name="geneset_systematic_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="geneset",
+            index=GinIndex(
+                fields=["name"],
+                name="geneset_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
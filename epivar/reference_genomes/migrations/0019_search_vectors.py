@@ -0,0 +1,113 @@
+import django.contrib.postgres.search
+from django.contrib.postgres.indexes import GinIndex
+from django.db import migrations
+
+
+# Row triggers keep search_doc current for every write path — ORM saves,
+# bulk_create and the COPY-based gene-set importer alike. The feature
+# document folds in the related collection/genome names; those are
+# effectively immutable, so the trigger reads them at write time instead
+# of cascading updates from the parent tables.
+GENESET_TRIGGER_SQL = """
+CREATE FUNCTION geneset_search_doc_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_doc := to_tsvector(
+        'simple',
+        concat_ws(
+            ' ',
+            NEW.name,
+            NEW.collection,
+            NEW.subcollection,
+            NEW.systematic_name
+        )
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER geneset_search_doc_trigger
+BEFORE INSERT OR UPDATE ON reference_genomes_geneset
+FOR EACH ROW EXECUTE FUNCTION geneset_search_doc_update();
+
+UPDATE reference_genomes_geneset SET search_doc = NULL;
+"""
+
+GENESET_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER geneset_search_doc_trigger ON reference_genomes_geneset;
+DROP FUNCTION geneset_search_doc_update();
+"""
+
+GENOMICFEATURE_TRIGGER_SQL = """
+CREATE FUNCTION genomicfeature_search_doc_update() RETURNS trigger AS $$
+DECLARE
+    genome_name text;
+    collection_name text;
+BEGIN
+    SELECT name INTO genome_name
+    FROM reference_genomes_referencegenome
+    WHERE id = NEW.reference_genome_id;
+
+    SELECT name INTO collection_name
+    FROM reference_genomes_genomicfeaturecollection
+    WHERE id = NEW.collection_id;
+
+    NEW.search_doc := to_tsvector(
+        'simple',
+        concat_ws(' ', NEW.name, NEW.description, genome_name, collection_name)
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER genomicfeature_search_doc_trigger
+BEFORE INSERT OR UPDATE ON reference_genomes_genomicfeature
+FOR EACH ROW EXECUTE FUNCTION genomicfeature_search_doc_update();
+
+UPDATE reference_genomes_genomicfeature SET search_doc = NULL;
+"""
+
+GENOMICFEATURE_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER genomicfeature_search_doc_trigger
+    ON reference_genomes_genomicfeature;
+DROP FUNCTION genomicfeature_search_doc_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reference_genomes", "0018_datatables_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="geneset",
+            name="search_doc",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="genomicfeature",
+            name="search_doc",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="geneset",
+            index=GinIndex(fields=["search_doc"], name="geneset_search_doc_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="genomicfeature",
+            index=GinIndex(fields=["search_doc"], name="genomicfeature_search_idx"),
+        ),
+        migrations.RunSQL(
+            sql=GENESET_TRIGGER_SQL,
+            reverse_sql=GENESET_TRIGGER_REVERSE_SQL,
+        ),
+        migrations.RunSQL(
+            sql=GENOMICFEATURE_TRIGGER_SQL,
+            reverse_sql=GENOMICFEATURE_TRIGGER_REVERSE_SQL,
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Drop the pg_trgm indexes superseded by the search_doc columns.
+
+    The DataTables search predicates on Postgres go through the GIN
+    indexes on search_doc since 0019; the trigram indexes no longer back
+    any query and only amplify writes on the two bulk-imported tables.
+    The pg_trgm extension itself stays installed (0018).
+    """
+
+    dependencies = [
+        ("reference_genomes", "0019_search_vectors"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="genomicfeature",
+            name="genomicfeature_name_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="genomicfeature",
+            name="genomicfeature_desc_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="geneset",
+            name="geneset_name_trgm_idx",
+        ),
+    ]
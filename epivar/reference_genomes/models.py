@@ -1,13 +1,96 @@
 import os
 import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.core.exceptions import ValidationError
+from django.core.files import File
 from django.core.files.storage import FileSystemStorage
 
 from pybedtools import BedTool
 from liftover import ChainFile as CF
 
+try:
+    # SIMD hash, several times faster per byte than MD5; checksums fall
+    # back to md5 when the wheel is not installed
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+
+# Algorithm recorded into the *_checksum fields. Rows written before the
+# switch keep their md5 digests; pin CHECKSUM_ALGORITHM = "md5" in
+# settings to keep producing them
+CHECKSUM_ALGORITHM = getattr(
+    settings, "CHECKSUM_ALGORITHM", "blake3" if blake3 is not None else "md5"
+)
+
+
+def checksum_hasher():
+    """New hash object for the configured checksum algorithm."""
+    if CHECKSUM_ALGORITHM == "blake3" and blake3 is not None:
+        return blake3()
+    return hashlib.new(CHECKSUM_ALGORITHM, usedforsecurity=False)
+
+
+def _file_checksum(file_field):
+    if not file_field:
+        return ""
+
+    # Committed files on FileSystemStorage have a local path — hash them
+    # through mmap so the kernel pages the content straight into the
+    # digest with no Python-driven read loop
+    try:
+        path = file_field.path
+    except (AttributeError, NotImplementedError, ValueError):
+        path = None
+
+    if path and os.path.isfile(path) and os.path.getsize(path) > 0:
+        if CHECKSUM_ALGORITHM == "blake3" and blake3 is not None:
+            return blake3().update_mmap(path).hexdigest()
+        with open(path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest = checksum_hasher()
+                digest.update(view)
+                return digest.hexdigest()
+
+    # Remote storage or a not-yet-committed upload: stream it.
+    # file_digest drives the read/update loop in C and releases the GIL;
+    # it takes a factory, so it works for blake3 as well
+    with file_field.open("rb") as handle:
+        return hashlib.file_digest(handle, checksum_hasher).hexdigest()
+
+
+class DigestingFile(File):
+    """File that hashes its content as it is streamed to storage.
+
+    FileSystemStorage copies uploads through chunks(); routing those
+    chunks through a hasher makes the checksum a by-product of the write
+    instead of a second read pass over the stored file.
+    """
+
+    DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, file, name=None):
+        super().__init__(file, name)
+        self.hasher = checksum_hasher()
+
+    def chunks(self, chunk_size=None):
+        # chunks() restarts from the beginning of the file, so restart
+        # the digest with it
+        self.hasher = checksum_hasher()
+        for chunk in super().chunks(chunk_size):
+            self.hasher.update(chunk)
+            yield chunk
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
 
 def upload_chain_file(instance, name):
     return os.path.join(
@@ -29,8 +112,16 @@ def upload_genomic_features_file(instance, name):
     )
 
 
+@lru_cache(maxsize=256)
+def _annotation_file_type(path, mtime, size):
+    # mtime/size act as the freshness key: a path is only re-parsed
+    # after the file itself changes
+    return BedTool(path).file_type
+
+
 def test_annotation_file(file):
-    file_type = BedTool(file.path).file_type
+    stat = os.stat(file.path)
+    file_type = _annotation_file_type(file.path, stat.st_mtime_ns, stat.st_size)
     if file_type != "gff":
         raise ValidationError("Parsing error: only gff files are supported!")
 
@@ -40,11 +131,22 @@ def test_index_file(file):
         raise ValidationError("Only .tbi files are allowed.")
 
 
-def test_chain_file(file):
+@lru_cache(maxsize=256)
+def _chain_file_error(path, mtime, size):
+    # Same freshness key as _annotation_file_type; parsing a multi-GB
+    # chain file is far too slow to repeat on every full_clean()
     try:
-        CF(file.path)
+        CF(path)
     except Exception as e:
-        ValidationError(f"Chain file validation error: {e}")
+        return str(e)
+    return None
+
+
+def test_chain_file(file):
+    stat = os.stat(file.path)
+    error = _chain_file_error(file.path, stat.st_mtime_ns, stat.st_size)
+    if error is not None:
+        raise ValidationError(f"Chain file validation error: {error}")
 
 
 def test_genomic_features_file(file):
@@ -115,55 +217,98 @@ class ReferenceGenome(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # (file field, checksum field) pairs kept in sync by save()
+    _CHECKSUM_FIELDS = (
+        ("annotations_file", "annotations_file_checksum"),
+        ("annotations_file_index", "annotations_file_index_checksum"),
+        ("chrom_size_file", "chrom_size_file_checksum"),
+        ("chrom_size_file_bed", "chrom_size_file_bed_checksum"),
+        ("chrom_size_file_bed_index", "chrom_size_file_bed_index_checksum"),
+    )
+
     class Meta:
         verbose_name_plural = "Reference Genomes"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot_file_state()
+
     def __str__(self):
         return f"{self.name} ({self.version})"
 
+    def _snapshot_file_state(self):
+        # Raw __dict__ values so deferred fields are not fetched here
+        self._loaded_file_names = {
+            field: str(self.__dict__[field]) if self.__dict__.get(field) else None
+            for field, _ in self._CHECKSUM_FIELDS
+            if field in self.__dict__
+        }
+        self._loaded_checksums = {
+            checksum_field: self.__dict__.get(checksum_field)
+            for _, checksum_field in self._CHECKSUM_FIELDS
+            if checksum_field in self.__dict__
+        }
+
+    def _dirty_checksum_fields(self):
+        for field, checksum_field in self._CHECKSUM_FIELDS:
+            file_field = getattr(self, field)
+            if not file_field:
+                continue
+            checksum = getattr(self, checksum_field)
+            if not checksum:
+                yield file_field, checksum_field
+                continue
+            file_changed = self.pk is None or file_field.name != (
+                self._loaded_file_names.get(field)
+            )
+            # A caller that replaced the file and also supplied a fresh
+            # checksum (the importers hash while downloading or writing)
+            # is trusted; re-hash only when the checksum went stale
+            if file_changed and checksum == self._loaded_checksums.get(checksum_field):
+                yield file_field, checksum_field
+
     @staticmethod
     def _calculate_checksum(file_field):
-        if not file_field:
-            return ""
-
-        md5 = hashlib.md5()
-        for chunk in file_field.chunks(chunk_size=64):
-            md5.update(chunk)
-        return md5.hexdigest()
+        return _file_checksum(file_field)
 
     def save(self, *args, **kwargs):
-        # Update checksums
-        if self.annotations_file:
-            self.annotations_file.open("rb")
-            self.annotations_file_checksum = self._calculate_checksum(
-                self.annotations_file
-            )
+        # Re-hash only files that changed since the instance was loaded —
+        # metadata-only edits no longer re-read multi-GB files
+        deferred = []
+        pending = []
+        for file_field, checksum_field in self._dirty_checksum_fields():
+            if isinstance(file_field.file, DigestingFile):
+                # Hashed while the storage streams it out below; read the
+                # digest after the write instead of a read pass now
+                deferred.append((file_field, checksum_field))
+            else:
+                pending.append((file_field, checksum_field))
+
+        if len(pending) == 1:
+            file_field, checksum_field = pending[0]
+            setattr(self, checksum_field, self._calculate_checksum(file_field))
+        elif pending:
+            # The files are independent and file_digest releases the GIL,
+            # so hashing them concurrently costs max(sizes), not
+            # sum(sizes) — annotations dominate the other four fields
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                futures = [
+                    (pool.submit(self._calculate_checksum, file_field), checksum_field)
+                    for file_field, checksum_field in pending
+                ]
+                for future, checksum_field in futures:
+                    setattr(self, checksum_field, future.result())
 
-        if self.annotations_file_index:
-            self.annotations_file_index.open("rb")
-            self.annotations_file_index_checksum = self._calculate_checksum(
-                self.annotations_file_index
-            )
-
-        if self.chrom_size_file:
-            self.chrom_size_file.open("rb")
-            self.chrom_size_file_checksum = self._calculate_checksum(
-                self.chrom_size_file
-            )
-
-        if self.chrom_size_file_bed:
-            self.chrom_size_file_bed.open("rb")
-            self.chrom_size_file_bed_checksum = self._calculate_checksum(
-                self.chrom_size_file_bed
-            )
+        super().save(*args, **kwargs)
 
-        if self.chrom_size_file_bed_index:
-            self.chrom_size_file_bed_index.open("rb")
-            self.chrom_size_file_bed_index_checksum = self._calculate_checksum(
-                self.chrom_size_file_bed_index
+        if deferred:
+            for file_field, checksum_field in deferred:
+                setattr(self, checksum_field, file_field.file.hexdigest())
+            super().save(
+                update_fields=[checksum_field for _, checksum_field in deferred]
             )
 
-        super().save(*args, **kwargs)
+        self._snapshot_file_state()
 
 
 class ChainFile(models.Model):
@@ -191,19 +336,12 @@ class ChainFile(models.Model):
 
     @staticmethod
     def _calculate_checksum(file_field):
-        if not file_field:
-            return ""
-
-        md5 = hashlib.md5()
-
-        for chunk in file_field.chunks(chunk_size=64):
-            md5.update(chunk)
-
-        return md5.hexdigest()
+        return _file_checksum(file_field)
 
     def save(self, *args, **kwargs):
-        if self.file:
-            self.file.open("rb")
+        # The importer hashes the file while downloading it; only compute
+        # here when no checksum was provided
+        if self.file and not self.file_checksum:
             self.file_checksum = self._calculate_checksum(self.file)
 
         super().save(*args, **kwargs)
@@ -270,33 +408,91 @@ class GenomicFeature(models.Model):
     )
     file_index_checksum = models.CharField(blank=True, null=True, editable=False)
 
+    # Maintained by a Postgres trigger (migration 0019) over name,
+    # description and the related collection/genome names
+    search_doc = SearchVectorField(null=True, editable=False)
+
+    # (file field, checksum field) pairs kept in sync by save()
+    _CHECKSUM_FIELDS = (
+        ("file", "file_checksum"),
+        ("file_index", "file_index_checksum"),
+    )
+
     class Meta:
         verbose_name_plural = "Genomic Features"
         ordering = ["name"]
+        indexes = [
+            # DataTables orders/filters on these; see GenomicFeatureDataView
+            models.Index(
+                fields=["collection", "reference_genome"],
+                name="genomicfeature_coll_ref_idx",
+            ),
+            GinIndex(fields=["search_doc"], name="genomicfeature_search_idx"),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot_file_state()
 
     def __str__(self):
         return f"{self.name}"
 
+    def _snapshot_file_state(self):
+        # Raw __dict__ values so deferred fields are not fetched here
+        self._loaded_file_names = {
+            field: str(self.__dict__[field]) if self.__dict__.get(field) else None
+            for field, _ in self._CHECKSUM_FIELDS
+            if field in self.__dict__
+        }
+        self._loaded_checksums = {
+            checksum_field: self.__dict__.get(checksum_field)
+            for _, checksum_field in self._CHECKSUM_FIELDS
+            if checksum_field in self.__dict__
+        }
+
+    def _dirty_checksum_fields(self):
+        for field, checksum_field in self._CHECKSUM_FIELDS:
+            file_field = getattr(self, field)
+            if not file_field:
+                continue
+            checksum = getattr(self, checksum_field)
+            if not checksum:
+                yield file_field, checksum_field
+                continue
+            file_changed = self.pk is None or file_field.name != (
+                self._loaded_file_names.get(field)
+            )
+            # A caller that replaced the file and also supplied a fresh
+            # checksum (the importers hash while downloading or writing)
+            # is trusted; re-hash only when the checksum went stale
+            if file_changed and checksum == self._loaded_checksums.get(checksum_field):
+                yield file_field, checksum_field
+
     @staticmethod
     def _calculate_checksum(file_field):
-        if not file_field:
-            return ""
-        md5 = hashlib.md5()
-        for chunk in file_field.chunks(chunk_size=64):
-            md5.update(chunk)
-        return md5.hexdigest()
+        return _file_checksum(file_field)
 
     def save(self, *args, **kwargs):
-        if self.file:
-            self.file.open("rb")
-            self.file_checksum = self._calculate_checksum(self.file)
-
-        if self.file_index:
-            self.file_index.open("rb")
-            self.file_index_checksum = self._calculate_checksum(self.file_index)
+        # Same dirty-tracking as ReferenceGenome: hash only replaced
+        # files, and let a DigestingFile hash during the storage write
+        deferred = []
+        for file_field, checksum_field in self._dirty_checksum_fields():
+            if isinstance(file_field.file, DigestingFile):
+                deferred.append((file_field, checksum_field))
+            else:
+                setattr(self, checksum_field, self._calculate_checksum(file_field))
 
         super().save(*args, **kwargs)
 
+        if deferred:
+            for file_field, checksum_field in deferred:
+                setattr(self, checksum_field, file_field.file.hexdigest())
+            super().save(
+                update_fields=[checksum_field for _, checksum_field in deferred]
+            )
+
+        self._snapshot_file_state()
+
 
 class GeneSetCollection(models.TextChoices):
     HALLMARK = "H", "Hallmark"
@@ -327,6 +523,10 @@ class GeneSet(models.Model):
     reference_url = models.URLField(blank=True, null=True)
     genes = models.JSONField()
 
+    # Maintained by a Postgres trigger (migration 0019) over name,
+    # collection, subcollection and systematic_name
+    search_doc = SearchVectorField(null=True, editable=False)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -334,6 +534,15 @@ class GeneSet(models.Model):
             ),
         ]
         ordering = ["name"]
+        indexes = [
+            # DataTables orders/filters on these; see GeneSetDataView
+            models.Index(
+                fields=["collection", "subcollection"],
+                name="geneset_collection_idx",
+            ),
+            models.Index(fields=["systematic_name"], name="geneset_systematic_idx"),
+            GinIndex(fields=["search_doc"], name="geneset_search_doc_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} [{self.collection}]"
@@ -1,10 +1,20 @@
 import os
 import shutil
 from django.conf import settings
+from django.core.cache import cache
 from django.dispatch import receiver
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
-from .models import ReferenceGenome, ChainFile, GenomicFeature
+from .models import ReferenceGenome, ChainFile, GenomicFeature, GeneSet
+
+
+@receiver(post_save, sender=GenomicFeature)
+@receiver(post_delete, sender=GenomicFeature)
+@receiver(post_save, sender=GeneSet)
+@receiver(post_delete, sender=GeneSet)
+def invalidate_total_count(sender, instance, **kwargs):
+    # Drop the cached recordsTotal used by the DataTables views
+    cache.delete(f"{sender._meta.label}:total")
 
 
 @receiver(post_delete, sender=GenomicFeature)
@@ -1,12 +1,57 @@
 from django.views.generic import ListView, DetailView
 
-from django.http import JsonResponse
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.views import View
-from django.db.models import Q
-from django.shortcuts import reverse
+from django.db import connection
+from django.db.models import Count, Q, Window
 
 from .models import ReferenceGenome, GenomicFeature, GeneSet
 
+try:
+    # ~3-6x faster than stdlib json for the DataTables payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_response(payload):
+    if orjson is not None:
+        return HttpResponse(orjson.dumps(payload), content_type="application/json")
+    return JsonResponse(payload)
+
+
+# DataTables column index -> (ascending, descending) ordering field,
+# matching the columns lists in the templates. A dict lookup with a
+# fallback also keeps an out-of-range index from raising IndexError
+GENOMIC_FEATURE_ORDER_COLUMNS = {
+    "0": ("name", "-name"),
+    "1": ("description", "-description"),
+    "2": ("collection", "-collection"),
+    "3": ("reference_genome", "-reference_genome"),
+    "4": ("id", "-id"),
+}
+
+GENE_SET_ORDER_COLUMNS = {
+    "0": ("name", "-name"),
+    "1": ("collection", "-collection"),
+    "2": ("subcollection", "-subcollection"),
+    "3": ("systematic_name", "-systematic_name"),
+    "4": ("id", "-id"),
+}
+
+
+def _total_count(model):
+    """Cached unfiltered COUNT(*) for DataTables recordsTotal.
+
+    The count only moves on inserts/deletes; signals invalidate the key
+    on ORM writes and the timeout covers bulk paths that bypass signals.
+    """
+    return cache.get_or_set(
+        f"{model._meta.label}:total", model.objects.count, timeout=300
+    )
+
 
 # ReferenceGenome
 class ReferenceGenomeListView(ListView):
@@ -48,53 +93,70 @@ class GenomicFeatureDataView(View):
         start = int(request.GET.get("start", 0))
         length = int(request.GET.get("length", 10))
         search_value = request.GET.get("search[value]", "")
-        order_col = request.GET.get("order[0][column]", 0)
+        order_col = request.GET.get("order[0][column]", "0")
         order_dir = request.GET.get("order[0][dir]", "asc")
 
-        # Columns must match the HTML <th> order in template
-        columns = ["name", "description", "collection", "reference_genome", "id"]
         queryset = GenomicFeature.objects.all()
 
-        # Filtering (search box)
+        # Filtering (search box): the trigger-maintained search_doc
+        # column turns four unindexable ILIKE '%...%' OR branches into
+        # one GIN-indexed predicate
         if search_value:
-            queryset = queryset.filter(
-                Q(name__icontains=search_value)
-                | Q(description__icontains=search_value)
-                | Q(reference_genome__name__icontains=search_value)
-                | Q(collection__name__icontains=search_value)
-            )
-
-        total_records = GenomicFeature.objects.count()
-        filtered_records = queryset.count()
+            if connection.vendor == "postgresql":
+                queryset = queryset.filter(
+                    search_doc=SearchQuery(search_value, search_type="websearch")
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(name__icontains=search_value)
+                    | Q(description__icontains=search_value)
+                    | Q(reference_genome__name__icontains=search_value)
+                    | Q(collection__name__icontains=search_value)
+                )
+
+        total_records = _total_count(GenomicFeature)
+
+        # The filtered count rides along as a window aggregate, so the
+        # page and recordsFiltered come back in a single query; values()
+        # pulls the related names through the join and skips model
+        # instantiation for the rows entirely
+        queryset = queryset.annotate(_filtered=Window(Count("pk"))).values(
+            "id",
+            "name",
+            "description",
+            "collection__name",
+            "reference_genome__name",
+            "_filtered",
+        )
 
         # Ordering
-        order_column = columns[int(order_col)]
-        if order_dir == "desc":
-            order_column = "-" + order_column
-        queryset = queryset.order_by(order_column)
+        asc, desc = GENOMIC_FEATURE_ORDER_COLUMNS.get(
+            order_col, GENOMIC_FEATURE_ORDER_COLUMNS["0"]
+        )
+        queryset = queryset.order_by(desc if order_dir == "desc" else asc)
 
         # Pagination
-        queryset = queryset[start : start + length]
-
-        # Build response
-        data = []
-        for feature in queryset:
-            data.append(
-                {
-                    "id": feature.id,
-                    "name": feature.name,
-                    "collection": feature.collection.name,
-                    "description": feature.description,
-                    "reference_genome": (
-                        feature.reference_genome.name
-                        if feature.reference_genome
-                        else ""
-                    ),
-                    "detail_url": reverse("genomic-feature-detail", args=[feature.id]),
-                }
-            )
-
-        return JsonResponse(
+        rows = list(queryset[start : start + length])
+        if rows:
+            filtered_records = rows[0]["_filtered"]
+        else:
+            # Page past the end of the filtered set
+            filtered_records = queryset.count()
+
+        # Build response; the detail link is rendered client-side from
+        # the id, so no per-row URL reverse is needed here
+        data = [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "collection": row["collection__name"],
+                "description": row["description"],
+                "reference_genome": row["reference_genome__name"] or "",
+            }
+            for row in rows
+        ]
+
+        return _json_response(
             {
                 "draw": draw,
                 "recordsTotal": total_records,
@@ -129,56 +191,64 @@ class GeneSetDataView(View):
         start = int(request.GET.get("start", 0))
         length = int(request.GET.get("length", 10))
         search_value = request.GET.get("search[value]", "")
-        order_col = request.GET.get("order[0][column]", 0)
+        order_col = request.GET.get("order[0][column]", "0")
         order_dir = request.GET.get("order[0][dir]", "asc")
 
-        # Column map (must match DataTables "columns" list in template)
-        columns = ["name", "collection", "subcollection", "systematic_name", "id"]
-
         queryset = GeneSet.objects.all()
 
-        # Filtering (search box)
+        # Filtering (search box): same indexed search_doc predicate as
+        # GenomicFeatureDataView
         if search_value:
-            queryset = queryset.filter(
-                Q(name__icontains=search_value)
-                | Q(collection__icontains=search_value)
-                | Q(subcollection__icontains=search_value)
-                | Q(systematic_name__icontains=search_value)
-            )
-
-        total_records = GeneSet.objects.count()
-        filtered_records = queryset.count()
+            if connection.vendor == "postgresql":
+                queryset = queryset.filter(
+                    search_doc=SearchQuery(search_value, search_type="websearch")
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(name__icontains=search_value)
+                    | Q(collection__icontains=search_value)
+                    | Q(subcollection__icontains=search_value)
+                    | Q(systematic_name__icontains=search_value)
+                )
+
+        total_records = _total_count(GeneSet)
+
+        # Same single-query values() pattern as GenomicFeatureDataView
+        queryset = queryset.annotate(_filtered=Window(Count("pk"))).values(
+            "id",
+            "name",
+            "collection",
+            "subcollection",
+            "systematic_name",
+            "_filtered",
+        )
 
         # Ordering
-        order_column = columns[int(order_col)]
-        if order_dir == "desc":
-            order_column = "-" + order_column
-        queryset = queryset.order_by(order_column)
+        asc, desc = GENE_SET_ORDER_COLUMNS.get(
+            order_col, GENE_SET_ORDER_COLUMNS["0"]
+        )
+        queryset = queryset.order_by(desc if order_dir == "desc" else asc)
 
         # Pagination
-        queryset = queryset[start : start + length]
-
-        # Build response
-        # Build response
-        data = []
-        for gs in queryset:
-            data.append(
-                {
-                    "id": gs.id,
-                    "name": gs.name,
-                    "collection": gs.collection,
-                    "subcollection": gs.subcollection,
-                    "systematic_name": gs.systematic_name,
-                    "detail_url": reverse("gene-set-detail", args=[gs.id]),
-                }
-            )
-
-        return JsonResponse(
+        rows = list(queryset[start : start + length])
+        if rows:
+            filtered_records = rows[0]["_filtered"]
+        else:
+            # Page past the end of the filtered set
+            filtered_records = queryset.count()
+
+        # Build response: the values() dicts already match the column
+        # names, so just strip the window annotation; the detail link is
+        # rendered client-side from the id
+        for row in rows:
+            del row["_filtered"]
+
+        return _json_response(
             {
                 "draw": draw,
                 "recordsTotal": total_records,
                 "recordsFiltered": filtered_records,
-                "data": data,
+                "data": rows,
             }
         )
 